@@ -2,12 +2,15 @@
 # v4.1 web
 
 import pygame
+from pygame.locals import K_a, K_d, K_w, K_s, K_LEFT, K_RIGHT, K_UP, K_DOWN, K_LSHIFT, K_RSHIFT
 import asyncio
 import random
 import math
-import time
+import array
+import operator
+from itertools import islice
 from enum import Enum
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, Set, Tuple, Optional
 
 # Initialize Pygame
 pygame.init()
@@ -19,6 +22,9 @@ FPS = 60
 TILE_SIZE = 48
 MAP_WIDTH = 150
 MAP_HEIGHT = 150
+CAMERA_MAX_X = MAP_WIDTH * TILE_SIZE - SCREEN_WIDTH  # Camera bounds keeping the view inside the map
+CAMERA_MAX_Y = MAP_HEIGHT * TILE_SIZE - SCREEN_HEIGHT
+HELP_BUTTON_RECT = pygame.Rect(15, SCREEN_HEIGHT - 50, 35, 35)  # Bottom left, shared by drawing and clicks
 
 # Colors
 WHITE = (255, 255, 255)
@@ -44,6 +50,100 @@ MYTHIC_COLOR = (255, 0, 0)  # Changed from YELLOW to RED
 LEGENDARY_COLOR = (255, 215, 0)
 TOOLS_COLOR = (0, 0, 0)
 
+# Sine lookup table for tile color animation, indexed by phase * SIN_LUT_SCALE
+SIN_LUT_SIZE = 1024
+SIN_LUT_MASK = SIN_LUT_SIZE - 1
+SIN_LUT_SCALE = SIN_LUT_SIZE / (2 * math.pi)
+SIN_LUT = array.array('f', [math.sin(i / SIN_LUT_SCALE) for i in range(SIN_LUT_SIZE)])
+
+# Tile animation speeds (radians per second)
+TILE_CYCLE_SPEED = 0.2
+WATER_WAVE_SPEED = 4.0
+SELL_GLOW_SPEED = 6.0
+WATER_PHASE_STEP = round(0.3 * SIN_LUT_SCALE)  # Wave phase shift per tile, in LUT steps
+# The same speeds as 16.16 fixed-point LUT steps per pygame tick (millisecond)
+TILE_CYCLE_TICK_STEP = round(TILE_CYCLE_SPEED * SIN_LUT_SCALE / 1000 * 65536)
+WATER_WAVE_TICK_STEP = round(WATER_WAVE_SPEED * SIN_LUT_SCALE / 1000 * 65536)
+SELL_GLOW_TICK_STEP = round(SELL_GLOW_SPEED * SIN_LUT_SCALE / 1000 * 65536)
+
+# Grass/soil/stone color cycling is quantized to a few brightness levels
+TILE_CYCLE_LEVELS = 8
+TILE_CYCLE_AMPLITUDE = 15
+TILE_CYCLE_LEVEL_LUT = array.array('B', [min(TILE_CYCLE_LEVELS - 1, int((s + 1) / 2 * TILE_CYCLE_LEVELS))
+                                         for s in SIN_LUT])
+WATER_COLOR_LUT = tuple((64 + int(10 * s), 164 + int(10 * s) // 2, 223) for s in SIN_LUT)
+TILE_ANIMATION_STRIDE = 4  # Frames between recoloring the visible map tiles
+TEXT_CACHE_LIMIT = 256  # Rendered UI texts kept before the cache is emptied
+PLANT_DRAW_MARGIN = 8  # Tiles around the viewport searched for plants whose sprites may reach it
+
+# Tile types, stored as small ints in Map.tiles_flat
+GRASS = 0
+SOIL = 1
+WATER = 2
+STONE = 3
+SELL_AREA = 4
+SOIL_GROWTH_BONUS = 1.1  # Growth rate multiplier for plants on soil
+
+# Tool kinds, indexing Player.tool_levels
+TOOL_FERTILIZER = 0
+TOOL_HOE = 1
+TOOL_SHOVEL = 2
+TOOL_KINDS = ('fertilizer', 'hoe', 'shovel')
+TOOL_NAMES = ('Basic', 'Iron', 'Gold', 'Diamond')  # Indexed by tool level
+# Info box label for every tool kind and level, e.g. TOOL_LABELS[TOOL_HOE][2] == "Hoe: Gold"
+TOOL_LABELS = tuple(tuple(f"{kind.capitalize()}: {name}" for name in TOOL_NAMES) for kind in TOOL_KINDS)
+
+# Weather particle fall speeds (pixels per second)
+RAIN_FALL_SPEED = 900
+SNOW_FALL_SPEED = 90
+
+# Item registry: every plant and tool name gets a stable integer id used to index inventories
+ITEM_IDS: Dict[str, int] = {}
+ITEM_NAMES: List[str] = []
+
+def register_item(name: str) -> int:
+    """Get the inventory id for an item name, assigning the next free id on first use"""
+    item_id = ITEM_IDS.get(name)
+    if item_id is None:
+        item_id = ITEM_IDS[name] = len(ITEM_NAMES)
+        ITEM_NAMES.append(name)
+    return item_id
+
+def tile_key(x: int, y: int) -> int:
+    """Pack a tile position into one int key; off-map positions give negative keys"""
+    return (y << 16) | x
+
+# Tile offsets on the square ring at each radius around a point, nearest first, built on first use
+RING_OFFSETS: Dict[int, Tuple[Tuple[int, int], ...]] = {}
+
+def get_ring_offsets(radius: int) -> Tuple[Tuple[int, int], ...]:
+    """Get the (dx, dy) offsets of the square ring at the given radius, sorted by squared distance"""
+    offsets = RING_OFFSETS.get(radius)
+    if offsets is None:
+        if radius == 0:
+            offsets = ((0, 0),)
+        else:
+            ring = [(dx, dy) for dx in range(-radius, radius + 1) for dy in range(-radius, radius + 1)
+                    if abs(dx) == radius or abs(dy) == radius]  # Only edge of circle
+            offsets = tuple(sorted(ring, key=lambda offset: (offset[0] * offset[0] + offset[1] * offset[1], offset[1], offset[0])))
+        RING_OFFSETS[radius] = offsets
+    return offsets
+
+# tile_key deltas within each circular harvest range, built on first use
+HARVEST_OFFSETS: Dict[int, Tuple[int, ...]] = {}
+
+def get_harvest_offsets(radius: int) -> Tuple[int, ...]:
+    """Get the tile_key deltas of the tiles within the circle of the given radius"""
+    offsets = HARVEST_OFFSETS.get(radius)
+    if offsets is None:
+        radius_sq = radius * radius
+        # tile_key(x + dx, y + dy) == tile_key(x, y) + (dy << 16) + dx while x + dx stays in 0..65535;
+        # tiles off the left edge wrap to x near 65535, where no plant can be
+        offsets = tuple((dy << 16) + dx for dy in range(-radius, radius + 1) for dx in range(-radius, radius + 1)
+                        if dx * dx + dy * dy <= radius_sq)
+        HARVEST_OFFSETS[radius] = offsets
+    return offsets
+
 class WeatherType(Enum):
     SUNNY = "sunny"
     CLOUDY = "cloudy"
@@ -55,13 +155,148 @@ class PlantType:
         def __init__(self, name: str, seed_cost: float, sell_value: float, growth_time: float, 
                  color: tuple, fruit_color: tuple = None, size: tuple = (1, 1), shape: str = 'rectangle'):
             self.name = name
+            self.item_id = register_item(name)
             self.seed_cost = seed_cost
             self.sell_value = sell_value
             self.growth_time = growth_time
             self.color = color
             self.fruit_color = fruit_color or color
+            self.fruit_highlight = tuple(min(255, c + 40) for c in self.fruit_color)
             self.size = size
             self.shape = shape  # 'rectangle', 'circle', 'star', or 'curved'
+            # Time remaining at which a growing plant reaches each stage (20%, 50%, 80% progress)
+            self.sprout_time_left = growth_time * 0.8
+            self.young_time_left = growth_time * 0.5
+            self.mature_time_left = growth_time * 0.2
+            # Growth stage sprites, rendered once on first use and shared by all plants of this type
+            self.stage_sprites: Dict['PlantGrowthStage', pygame.Surface] = {}
+            # Room around the plant's tiles for leaves and fruit that spill past them
+            self.sprite_padding = 32 * min(size)
+            # Tiles covered by this shape, relative to the plant's top-left tile
+            self.tile_offsets: Tuple[Tuple[int, int], ...] = self._shape_offsets()
+            # Shop tools only: 'fertilizer', 'hoe' or 'shovel', its index in TOOL_KINDS, and the upgrade level it grants
+            self.tool_kind: Optional[str] = None
+            self.tool_id: Optional[int] = None
+            self.tool_level = 0
+
+        def _shape_offsets(self) -> Tuple[Tuple[int, int], ...]:
+            """Get the tile offsets covered by this plant's shape and size"""
+            offsets = []
+            w, h = self.size
+            
+            if self.shape == 'rectangle':
+                for dy in range(h):
+                    for dx in range(w):
+                        offsets.append((dx, dy))
+                        
+            elif self.shape == 'circle':
+                center_x = w//2
+                center_y = h//2
+                radius = min(w, h)//2
+                for dy in range(-radius, radius+1):
+                    for dx in range(-radius, radius+1):
+                        if dx*dx + dy*dy <= radius*radius:
+                            offsets.append((center_x + dx, center_y + dy))
+                            
+            elif self.shape == 'star':
+                # 5-point star pattern for 3x3 plants
+                star_points = [
+                    (1,0), (0,1), (2,1),  # Top and sides
+                    (0,2), (2,2),         # Bottom corners
+                    (1,1), (1,2)          # Center and bottom
+                ]
+                offsets.extend(star_points)
+                    
+            elif self.shape == 'curved':
+                # Curved rectangle (rounded corners)
+                corners = [(0,0), (w-1,0), (0,h-1), (w-1,h-1)]  # Corner points excluded
+                for dy in range(h):
+                    for dx in range(w):
+                        if (dx,dy) not in corners:
+                            offsets.append((dx, dy))
+            
+            return tuple(offsets)
+
+        def get_stage_sprite(self, stage: 'PlantGrowthStage') -> pygame.Surface:
+            """Get the cached sprite for a growth stage, rendering it on first use"""
+            sprite = self.stage_sprites.get(stage)
+            if sprite is None:
+                sprite = self._render_stage(stage)
+                self.stage_sprites[stage] = sprite
+            return sprite
+
+        def _render_stage(self, stage: 'PlantGrowthStage') -> pygame.Surface:
+            """Render the detailed plant at a growth stage onto a transparent sprite"""
+            pad = self.sprite_padding
+            width, height = self.size
+            sprite = pygame.Surface((TILE_SIZE * width + 2 * pad, TILE_SIZE * height + 2 * pad),
+                                    pygame.SRCALPHA).convert_alpha()
+
+            # Local aliases for the draw primitives and colors used on every tile
+            circle = pygame.draw.circle
+            rect_fill = pygame.draw.rect
+            ellipse = pygame.draw.ellipse
+            color = self.color
+            fruit_color = self.fruit_color
+            fruit_highlight = self.fruit_highlight
+
+            # Scale plant parts based on plant size for larger plants
+            sf = min(width, height)
+
+            # Draw on all occupied tiles
+            for dy in range(height):
+                for dx in range(width):
+                    # Center of the tile's inset rect
+                    center_x = pad + dx * TILE_SIZE + TILE_SIZE // 2
+                    center_y = pad + dy * TILE_SIZE + TILE_SIZE // 2
+
+                    if stage == PlantGrowthStage.SEED:
+                        # Small brown seed with detail
+                        circle(sprite, BROWN, (center_x, center_y), 4 * sf)
+                        circle(sprite, (80, 40, 20), (center_x - 1, center_y - 1), 2 * sf)
+                    elif stage == PlantGrowthStage.SPROUT:
+                        # Green sprout with stem
+                        circle(sprite, LIGHT_GREEN, (center_x, center_y - 5), 8 * sf)
+                        rect_fill(sprite, DARK_GREEN, (center_x - 2*sf, center_y - 2, 4*sf, 12))
+                        # Small leaves
+                        ellipse(sprite, LIGHT_GREEN, (center_x - 6*sf, center_y - 8, 8*sf, 4))
+                    elif stage == PlantGrowthStage.YOUNG:
+                        # Larger plant with multiple leaves
+                        circle(sprite, color, (center_x, center_y - 8), 12 * sf)
+                        rect_fill(sprite, DARK_GREEN, (center_x - 3*sf, center_y - 5, 6*sf, 18))
+                        # Multiple leaves
+                        leaf_width = 10 * sf
+                        for ldx, ldy in ((-8, -12), (8, -12), (-6, -6), (6, -6)):
+                            ellipse(sprite, color, (center_x + ldx*sf, center_y + ldy, leaf_width, 6))
+                    elif stage == PlantGrowthStage.MATURE:
+                        # Full size plant with thick stem
+                        circle(sprite, color, (center_x, center_y - 12), 16 * sf)
+                        rect_fill(sprite, DARK_GREEN, (center_x - 4*sf, center_y - 8, 8*sf, 24))
+                        # Large leaves
+                        leaf_width = 14 * sf
+                        for ldx, ldy in ((-12, -16), (12, -16), (-8, -8), (8, -8), (-10, -4), (10, -4)):
+                            ellipse(sprite, color, (center_x + ldx*sf, center_y + ldy, leaf_width, 8))
+                    elif stage == PlantGrowthStage.HARVESTABLE:
+                        # Full plant with detailed fruits/flowers
+                        circle(sprite, color, (center_x, center_y - 15), 18 * sf)
+                        rect_fill(sprite, DARK_GREEN, (center_x - 5*sf, center_y - 10, 10*sf, 28))
+
+                        # Large leaves
+                        leaf_width = 16 * sf
+                        for ldx, ldy in ((-15, -20), (15, -20), (-10, -12), (10, -12), (-12, -6), (12, -6)):
+                            ellipse(sprite, color, (center_x + ldx*sf, center_y + ldy, leaf_width, 10))
+
+                        # Detailed fruits/flowers
+                        fruit_radius = 6 * sf
+                        highlight_radius = 3 * sf
+                        for fx, fy in ((-10, -18), (10, -18), (-6, -12), (6, -12), (0, -8)):
+                            fruit_x, fruit_y = center_x + fx*sf, center_y + fy
+                            # Main fruit
+                            circle(sprite, fruit_color, (fruit_x, fruit_y), fruit_radius)
+                            # Highlight
+                            circle(sprite, fruit_highlight, (fruit_x - 2, fruit_y - 2), highlight_radius)
+
+            return sprite
 
 class PlantGrowthStage(Enum):
     SEED = 0
@@ -71,49 +306,24 @@ class PlantGrowthStage(Enum):
     HARVESTABLE = 4
 
 class Plant:
-    def __init__(self, plant_type: PlantType, x: int, y: int):
+    def __init__(self, plant_type: PlantType, x: int, y: int, tile_type: int = GRASS):
         self.plant_type = plant_type
         self.x = x
         self.y = y
-        self.planted_time = time.time()
+        # Plants never move, so the tiles they cover and their tile_key keys are fixed
+        self.occupied_tiles = tuple((x + dx, y + dy) for dx, dy in plant_type.tile_offsets)
+        self.tile_keys = tuple(tile_key(tile_x, tile_y) for tile_x, tile_y in self.occupied_tiles)
+        # Tiles never change, so the soil buff of the plant's tile is fixed at planting
+        self.growth_rate = SOIL_GROWTH_BONUS if tile_type == SOIL else 1.0
+        self.planted_tick = pygame.time.get_ticks()
         self.stage = PlantGrowthStage.SEED
         self.harvestable = False
         self.time_remaining = plant_type.growth_time  # Store actual time remaining
-        self.last_update = time.time()  # Track last update time
+        self.last_tick = self.planted_tick  # Tick of the last growth update
 
-    def update(self, weather_multiplier: float = 1.0, fertilizer_multiplier: float = 1.0, tile_type: str = 'grass'):
-        """Update plant growth based on time passed with multipliers affecting rate"""
-        if self.harvestable:
-            return
-
-        current_time = time.time()
-        elapsed = current_time - self.last_update
-        
-        # Calculate soil multiplier
-        soil_multiplier = 1.1 if tile_type == 'soil' else 1.0  # 1.1x buff on soil
-        
-        # Calculate how much time to subtract based on multipliers
-        total_multiplier = weather_multiplier * fertilizer_multiplier * soil_multiplier
-        time_reduction = elapsed * total_multiplier
-        
-        # Update time remaining
-        self.time_remaining = max(0, self.time_remaining - time_reduction)
-        self.last_update = current_time
-
-        # Calculate growth progress
-        progress = 1.0 - (self.time_remaining / self.plant_type.growth_time)
-        
-        if self.time_remaining <= 0:
-            self.stage = PlantGrowthStage.HARVESTABLE
-            self.harvestable = True
-        elif progress >= 0.8:
-            self.stage = PlantGrowthStage.MATURE
-        elif progress >= 0.5:
-            self.stage = PlantGrowthStage.YOUNG
-        elif progress >= 0.2:
-            self.stage = PlantGrowthStage.SPROUT
-        else:
-            self.stage = PlantGrowthStage.SEED
+    def update(self, now: int, growth_multiplier: float = 1.0):
+        """Update plant growth up to tick now; growth_multiplier is the combined weather and fertilizer rate"""
+        tick_plants((self,), now, growth_multiplier)
 
     def get_time_remaining(self, weather_multiplier: float = 1.0, fertilizer_multiplier: float = 1.0) -> float:
         """Get remaining time in seconds until harvestable"""
@@ -121,150 +331,182 @@ class Plant:
             return 0.0
         return max(0.0, self.time_remaining)
     
-    def get_occupied_tiles(self) -> List[Tuple[int, int]]:
-        """Get list of all tiles this plant occupies based on its shape"""
-        tiles = []
-        w, h = self.plant_type.size
-        
-        if self.plant_type.shape == 'rectangle':
-            for dy in range(h):
-                for dx in range(w):
-                    tiles.append((self.x + dx, self.y + dy))
-                    
-        elif self.plant_type.shape == 'circle':
-            center_x = self.x + w//2
-            center_y = self.y + h//2
-            radius = min(w, h)//2
-            for dy in range(-radius, radius+1):
-                for dx in range(-radius, radius+1):
-                    if dx*dx + dy*dy <= radius*radius:
-                        tiles.append((center_x + dx, center_y + dy))
-                        
-        elif self.plant_type.shape == 'star':
-            # 5-point star pattern for 3x3 plants
-            star_points = [
-                (1,0), (0,1), (2,1),  # Top and sides
-                (0,2), (2,2),         # Bottom corners
-                (1,1), (1,2)          # Center and bottom
-            ]
-            for dx, dy in star_points:
-                tiles.append((self.x + dx, self.y + dy))
-                
-        elif self.plant_type.shape == 'curved':
-            # Curved rectangle (rounded corners)
-            corners = [(0,0), (w-1,0), (0,h-1), (w-1,h-1)]  # Corner points excluded
-            for dy in range(h):
-                for dx in range(w):
-                    if (dx,dy) not in corners:
-                        tiles.append((self.x + dx, self.y + dy))
-        
-        return tiles
+    def get_occupied_tiles(self) -> Tuple[Tuple[int, int], ...]:
+        """Get all tiles this plant occupies based on its shape"""
+        return self.occupied_tiles
             
+    def get_blit(self, camera_x: int, camera_y: int) -> Tuple[pygame.Surface, Tuple[int, int]]:
+        """Get the cached sprite for the current growth stage and its screen position"""
+        plant_type = self.plant_type
+        pad = plant_type.sprite_padding
+        return (plant_type.get_stage_sprite(self.stage),
+                (self.x * TILE_SIZE - camera_x - pad, self.y * TILE_SIZE - camera_y - pad))
+
     def draw(self, screen: pygame.Surface, camera_x: int, camera_y: int):
         """Draw the detailed plant at its current growth stage"""
-        # Draw on all occupied tiles
-        for dy in range(self.plant_type.size[1]):
-            for dx in range(self.plant_type.size[0]):
-                tile_x = self.x + dx
-                tile_y = self.y + dy
-                screen_x = tile_x * TILE_SIZE - camera_x
-                screen_y = tile_y * TILE_SIZE - camera_y
-                
-                # Don't draw if off screen
-                if (screen_x < -TILE_SIZE or screen_x > SCREEN_WIDTH or 
-                    screen_y < -TILE_SIZE or screen_y > SCREEN_HEIGHT):
-                    continue
-                    
-                rect = pygame.Rect(screen_x + 4, screen_y + 4, TILE_SIZE - 8, TILE_SIZE - 8)
-                center_x, center_y = rect.center
-                
-                # Scale plant parts based on plant size for larger plants
-                scale_factor = min(self.plant_type.size[0], self.plant_type.size[1])
+        screen.blit(*self.get_blit(camera_x, camera_y))
+
+def tick_plants(plants, now: int, growth_multiplier: float = 1.0) -> List[Plant]:
+    """Advance the growth of every plant up to tick now in a single loop; returns the plants that just ripened"""
+    ripened = []
+    seed, sprout, young, mature, harvestable = (PlantGrowthStage.SEED, PlantGrowthStage.SPROUT, PlantGrowthStage.YOUNG,
+                                                PlantGrowthStage.MATURE, PlantGrowthStage.HARVESTABLE)
+    for plant in plants:
+        if plant.harvestable:
+            continue
+
+        # Update time remaining
+        elapsed = (now - plant.last_tick) * 0.001
+        time_remaining = plant.time_remaining - elapsed * growth_multiplier * plant.growth_rate
+        plant.last_tick = now
+
+        # Compare against the plant type's precomputed stage thresholds
+        if time_remaining <= 0:
+            plant.time_remaining = 0
+            plant.stage = harvestable
+            plant.harvestable = True
+            ripened.append(plant)
+            continue
+        plant.time_remaining = time_remaining
+        plant_type = plant.plant_type
+        if time_remaining <= plant_type.mature_time_left:
+            plant.stage = mature
+        elif time_remaining <= plant_type.young_time_left:
+            plant.stage = young
+        elif time_remaining <= plant_type.sprout_time_left:
+            plant.stage = sprout
+        else:
+            plant.stage = seed
+    return ripened
+
+class PlantGrid:
+    def __init__(self, cell_shift: int = 4):
+        self.cell_shift = cell_shift  # Cells are 2**cell_shift tiles wide and high (16 by default)
+        # Plants bucketed by the grid cell of their top-left tile
+        self.buckets: Dict[Tuple[int, int], List[Plant]] = {}
+        
+    def get_cell(self, x: int, y: int) -> Tuple[int, int]:
+        """Get the grid cell containing a tile"""
+        return x >> self.cell_shift, y >> self.cell_shift
+        
+    def add(self, plant: Plant):
+        """Add a plant to the bucket of its top-left tile"""
+        self.buckets.setdefault(self.get_cell(plant.x, plant.y), []).append(plant)
+        
+    def remove(self, plant: Plant):
+        """Remove a plant from its bucket"""
+        cell = self.get_cell(plant.x, plant.y)
+        bucket = self.buckets.get(cell)
+        if bucket and plant in bucket:
+            bucket.remove(plant)
+            if not bucket:
+                del self.buckets[cell]
                 
-                if self.stage == PlantGrowthStage.SEED:
-                    # Small brown seed with detail
-                    pygame.draw.circle(screen, BROWN, (center_x, center_y), 4 * scale_factor)
-                    pygame.draw.circle(screen, (80, 40, 20), (center_x - 1, center_y - 1), 2 * scale_factor)
-                elif self.stage == PlantGrowthStage.SPROUT:
-                    # Green sprout with stem
-                    pygame.draw.circle(screen, LIGHT_GREEN, (center_x, center_y - 5), 8 * scale_factor)
-                    pygame.draw.rect(screen, DARK_GREEN, (center_x - 2*scale_factor, center_y - 2, 4*scale_factor, 12))
-                    # Small leaves
-                    pygame.draw.ellipse(screen, LIGHT_GREEN, (center_x - 6*scale_factor, center_y - 8, 8*scale_factor, 4))
-                elif self.stage == PlantGrowthStage.YOUNG:
-                    # Larger plant with multiple leaves
-                    pygame.draw.circle(screen, self.plant_type.color, (center_x, center_y - 8), 12 * scale_factor)
-                    pygame.draw.rect(screen, DARK_GREEN, (center_x - 3*scale_factor, center_y - 5, 6*scale_factor, 18))
-                    # Multiple leaves
-                    for i, (ldx, ldy) in enumerate([(-8, -12), (8, -12), (-6, -6), (6, -6)]):
-                        pygame.draw.ellipse(screen, self.plant_type.color, 
-                                           (center_x + ldx*scale_factor, center_y + ldy, 10*scale_factor, 6))
-                elif self.stage == PlantGrowthStage.MATURE:
-                    # Full size plant with thick stem
-                    pygame.draw.circle(screen, self.plant_type.color, (center_x, center_y - 12), 16 * scale_factor)
-                    pygame.draw.rect(screen, DARK_GREEN, (center_x - 4*scale_factor, center_y - 8, 8*scale_factor, 24))
-                    # Large leaves
-                    for i, (ldx, ldy) in enumerate([(-12, -16), (12, -16), (-8, -8), (8, -8), (-10, -4), (10, -4)]):
-                        pygame.draw.ellipse(screen, self.plant_type.color, 
-                                           (center_x + ldx*scale_factor, center_y + ldy, 14*scale_factor, 8))
-                elif self.stage == PlantGrowthStage.HARVESTABLE:
-                    # Full plant with detailed fruits/flowers
-                    pygame.draw.circle(screen, self.plant_type.color, (center_x, center_y - 15), 18 * scale_factor)
-                    pygame.draw.rect(screen, DARK_GREEN, (center_x - 5*scale_factor, center_y - 10, 10*scale_factor, 28))
-                    
-                    # Large leaves
-                    for i, (ldx, ldy) in enumerate([(-15, -20), (15, -20), (-10, -12), (10, -12), (-12, -6), (12, -6)]):
-                        pygame.draw.ellipse(screen, self.plant_type.color, 
-                                           (center_x + ldx*scale_factor, center_y + ldy, 16*scale_factor, 10))
-                    
-                    # Detailed fruits/flowers
-                    fruit_positions = [(-10, -18), (10, -18), (-6, -12), (6, -12), (0, -8)]
-                    for fx, fy in fruit_positions:
-                        fruit_x, fruit_y = center_x + fx*scale_factor, center_y + fy
-                        # Main fruit
-                        pygame.draw.circle(screen, self.plant_type.fruit_color, (fruit_x, fruit_y), 6 * scale_factor)
-                        # Highlight
-                        pygame.draw.circle(screen, tuple(min(255, c + 40) for c in self.plant_type.fruit_color), 
-                                         (fruit_x - 2, fruit_y - 2), 3 * scale_factor)
+    def query_rect(self, x0: int, y0: int, x1: int, y1: int) -> List[Plant]:
+        """Get plants in every cell overlapping the tile rectangle x0..x1, y0..y1 (inclusive)"""
+        found = []
+        shift = self.cell_shift
+        buckets = self.buckets
+        cell_xs = range(x0 >> shift, (x1 >> shift) + 1)
+        for cell_y in range(y0 >> shift, (y1 >> shift) + 1):
+            for cell_x in cell_xs:
+                bucket = buckets.get((cell_x, cell_y))
+                if bucket:
+                    found.extend(bucket)
+        return found
 
 class Inventory:
     def __init__(self):
-        self.seeds: Dict[str, int] = {}
-        self.items: Dict[str, int] = {}
-        
-    def add_seeds(self, plant_name: str, quantity: int):
-        self.seeds[plant_name] = self.seeds.get(plant_name, 0) + quantity
-        
-    def use_seed(self, plant_name: str) -> bool:
-        if self.seeds.get(plant_name, 0) > 0:
-            self.seeds[plant_name] -= 1
-            if self.seeds[plant_name] == 0:
-                del self.seeds[plant_name]
+        # Counts indexed by item id (see register_item)
+        self.seed_counts: List[int] = [0] * len(ITEM_NAMES)
+        self.item_counts: List[int] = [0] * len(ITEM_NAMES)
+        # (name, quantity) lists for the UI, rebuilt lazily after a count changes
+        self._seeds_view: Optional[List[Tuple[str, int]]] = None
+        self._items_view: Optional[List[Tuple[str, int]]] = None
+        
+    def _fit(self, counts: List[int], item_id: int):
+        """Grow a count list to cover items registered after it was created"""
+        if item_id >= len(counts):
+            counts.extend([0] * (len(ITEM_NAMES) - len(counts)))
+        
+    def add_seeds(self, item_id: int, quantity: int):
+        self._fit(self.seed_counts, item_id)
+        self.seed_counts[item_id] += quantity
+        self._seeds_view = None
+        
+    def use_seed(self, item_id: int) -> bool:
+        counts = self.seed_counts
+        if item_id < len(counts) and counts[item_id] > 0:
+            counts[item_id] -= 1
+            self._seeds_view = None
             return True
         return False
         
-    def add_item(self, item_name: str, quantity: int):
-        self.items[item_name] = self.items.get(item_name, 0) + quantity
+    def add_item(self, item_id: int, quantity: int):
+        self._fit(self.item_counts, item_id)
+        self.item_counts[item_id] += quantity
+        self._items_view = None
         
-    def remove_item(self, item_name: str, quantity: int) -> bool:
-        if self.items.get(item_name, 0) >= quantity:
-            self.items[item_name] -= quantity
-            if self.items[item_name] == 0:
-                del self.items[item_name]
+    def remove_item(self, item_id: int, quantity: int) -> bool:
+        counts = self.item_counts
+        if item_id < len(counts) and counts[item_id] >= quantity:
+            counts[item_id] -= quantity
+            self._items_view = None
             return True
         return False
+        
+    def clear_items(self):
+        """Drop every harvested item"""
+        self.item_counts = [0] * len(self.item_counts)
+        self._items_view = None
+        
+    def get_seeds(self) -> List[Tuple[str, int]]:
+        """Get (name, quantity) for every seed held; the returned list is shared, don't modify it"""
+        if self._seeds_view is None:
+            self._seeds_view = [(ITEM_NAMES[item_id], count) for item_id, count in enumerate(self.seed_counts) if count]
+        return self._seeds_view
+        
+    def get_items(self) -> List[Tuple[str, int]]:
+        """Get (name, quantity) for every harvested item held; the returned list is shared, don't modify it"""
+        if self._items_view is None:
+            self._items_view = [(ITEM_NAMES[item_id], count) for item_id, count in enumerate(self.item_counts) if count]
+        return self._items_view
 
 class Player:
     def __init__(self, x: int, y: int):
-        self.x = x
-        self.y = y
+        self.set_position(x, y)
         self.speed = 160  # Reduced from 200 to 160 (0.8x)
         self.money = 10.0  # Starting money as float #starting #inital #balance
         self.inventory = Inventory()
+        # Tool levels indexed by TOOL_FERTILIZER, TOOL_HOE and TOOL_SHOVEL
         # Fertilizer levels: 0=basic(1x), 1=iron(2x), 2=gold(10x), 3=diamond(100x)
-        self.fertilizer_level = 0
-        self.hoe_level = 0  # 0=basic(2), 1=iron(8), 2=gold(20), 3=diamond(100)
-        self.shovel_level = 0  # 0=basic(1), 1=iron(4), 2=gold(8), 3=diamond(15)
+        # Hoe levels: 0=basic(2), 1=iron(8), 2=gold(20), 3=diamond(100)
+        # Shovel levels: 0=basic(1), 1=iron(4), 2=gold(8), 3=diamond(15)
+        self.tool_levels = [0, 0, 0]
+        
+    @property
+    def fertilizer_level(self) -> int:
+        return self.tool_levels[TOOL_FERTILIZER]
+        
+    @fertilizer_level.setter
+    def fertilizer_level(self, level: int):
+        self.tool_levels[TOOL_FERTILIZER] = level
+        
+    @property
+    def hoe_level(self) -> int:
+        return self.tool_levels[TOOL_HOE]
+        
+    @hoe_level.setter
+    def hoe_level(self, level: int):
+        self.tool_levels[TOOL_HOE] = level
+        
+    @property
+    def shovel_level(self) -> int:
+        return self.tool_levels[TOOL_SHOVEL]
+        
+    @shovel_level.setter
+    def shovel_level(self, level: int):
+        self.tool_levels[TOOL_SHOVEL] = level
         
     def get_fertilizer_multiplier(self) -> float:
         """Get current fertilizer growth speed multiplier"""
@@ -290,17 +532,24 @@ class Player:
         """Update player position based on input"""
         dx = dy = 0
         
+        # Read each key state once
+        left = keys[K_a] or keys[K_LEFT]
+        right = keys[K_d] or keys[K_RIGHT]
+        up = keys[K_w] or keys[K_UP]
+        down = keys[K_s] or keys[K_DOWN]
+        shift = keys[K_LSHIFT] or keys[K_RSHIFT]
+        
         # Check for shift key (speed boost)
-        speed_multiplier = 3.0 if keys[pygame.K_LSHIFT] or keys[pygame.K_RSHIFT] else 1.0
+        speed_multiplier = 3.0 if shift else 1.0
         current_speed = self.speed * speed_multiplier
         
-        if keys[pygame.K_a] or keys[pygame.K_LEFT]:
+        if left:
             dx = -current_speed * dt
-        if keys[pygame.K_d] or keys[pygame.K_RIGHT]:
+        if right:
             dx = current_speed * dt
-        if keys[pygame.K_w] or keys[pygame.K_UP]:
+        if up:
             dy = -current_speed * dt
-        if keys[pygame.K_s] or keys[pygame.K_DOWN]:
+        if down:
             dy = current_speed * dt
             
         # Check collision and update position
@@ -314,10 +563,17 @@ class Player:
         if map_obj.is_walkable(tile_x, tile_y):
             self.x = new_x
             self.y = new_y
+            self.tile_position = (tile_x, tile_y)
             
+    def set_position(self, x: float, y: float):
+        """Move the player to pixel position x, y, keeping tile_position in step"""
+        self.x = x
+        self.y = y
+        self.tile_position = (int(x // TILE_SIZE), int(y // TILE_SIZE))
+        
     def get_tile_position(self) -> Tuple[int, int]:
         """Get the tile coordinates the player is standing on"""
-        return int(self.x // TILE_SIZE), int(self.y // TILE_SIZE)
+        return self.tile_position
         
     def draw(self, screen: pygame.Surface, camera_x: int, camera_y: int):
         """Draw the detailed player"""
@@ -355,9 +611,53 @@ class Weather:
         self.weather_duration = 85  # Check every 85 seconds for weather change
         self.current_special_duration = 0  # Duration for current special weather
 
+        # Every rain streak falls at the same speed, so they are drawn once onto a
+        # screen-sized, seamlessly wrapping layer that scrolls as a whole
+        self.rain_layer = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        self.rain_layer.fill(BLACK)
+        for _ in range(100):
+            x = random.uniform(0, SCREEN_WIDTH)
+            y = random.uniform(0, SCREEN_HEIGHT)
+            # Repeat streaks that cross the right or bottom edge on the opposite side
+            for wrap_x in (x, x - SCREEN_WIDTH):
+                for wrap_y in (y, y - SCREEN_HEIGHT):
+                    pygame.draw.line(self.rain_layer, BLUE, (wrap_x + 1, wrap_y + 1), (wrap_x + 4, wrap_y + 16), 2)
+        self.rain_layer.set_colorkey(BLACK, pygame.RLEACCEL)
+        self.rain_offset_x = 0.0
+        self.rain_offset_y = 0.0
+
+        # Snowflake sprites, drawn once and blitted for every particle
+        self.snow_sprites = []
+        for radius in range(2, 5):
+            sprite = pygame.Surface((radius * 2 + 1, radius * 2 + 1), pygame.SRCALPHA).convert_alpha()
+            pygame.draw.circle(sprite, WHITE, (radius, radius), radius)
+            self.snow_sprites.append(sprite)
+
+        # Fixed snowflake pool that falls and wraps around the screen
+        self.snow_flakes = [[random.uniform(0, SCREEN_WIDTH), random.uniform(0, SCREEN_HEIGHT),
+                             random.choice(self.snow_sprites)] for _ in range(50)]
+
+        # Cloud overlay, filled once and reused every cloudy frame
+        self.cloud_overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        self.cloud_overlay.fill(GRAY)
+        self.cloud_overlay.set_alpha(30)
+
+    def update_particles(self, dt: float):
+        """Advance falling rain or snow particles"""
+        if self.current_weather == WeatherType.RAINY:
+            fall = RAIN_FALL_SPEED * dt
+            drift = fall * 0.2  # Same slant as the streaks
+            self.rain_offset_x = (self.rain_offset_x + drift) % SCREEN_WIDTH
+            self.rain_offset_y = (self.rain_offset_y + fall) % SCREEN_HEIGHT
+        elif self.current_weather == WeatherType.SNOWING:
+            fall = SNOW_FALL_SPEED * dt
+            for flake in self.snow_flakes:
+                flake[1] = (flake[1] + fall) % SCREEN_HEIGHT
+
     def update(self, dt: float):
         """Update weather system"""
         self.weather_timer += dt
+        self.update_particles(dt)
 
         # If in special weather (RAINY or SNOWING), check if duration is up
         if self.current_weather in [WeatherType.RAINY, WeatherType.SNOWING]:
@@ -392,37 +692,48 @@ class Weather:
             return 0.75  # 25% slower time passage
         return 1.0  # Normal speed for sunny/cloudy
 
+    @property
+    def has_effects(self) -> bool:
+        """Whether the current weather draws anything; sunny weather draws nothing"""
+        return self.current_weather is not WeatherType.SUNNY
+
     def draw_effects(self, screen: pygame.Surface):
         """Draw weather effects"""
         if self.current_weather == WeatherType.RAINY:
-            # Draw rain
-            for _ in range(100):
-                x = random.randint(0, SCREEN_WIDTH)
-                y = random.randint(0, SCREEN_HEIGHT)
-                pygame.draw.line(screen, BLUE, (x, y), (x + 3, y + 15), 2)
+            # Draw rain: the wrapped layer as four clipped pieces covering the screen once
+            rain_layer = self.rain_layer
+            x = int(self.rain_offset_x)
+            y = int(self.rain_offset_y)
+            screen.blits([(rain_layer, (x, y)), (rain_layer, (x - SCREEN_WIDTH, y)),
+                          (rain_layer, (x, y - SCREEN_HEIGHT)), (rain_layer, (x - SCREEN_WIDTH, y - SCREEN_HEIGHT))],
+                         doreturn=False)
         elif self.current_weather == WeatherType.SNOWING:
             # Draw snow
-            for _ in range(50):
-                x = random.randint(0, SCREEN_WIDTH)
-                y = random.randint(0, SCREEN_HEIGHT)
-                pygame.draw.circle(screen, WHITE, (x, y), random.randint(2, 4))
+            screen.blits([(sprite, (x, y)) for x, y, sprite in self.snow_flakes], doreturn=False)
         elif self.current_weather == WeatherType.CLOUDY:
             # Draw cloud overlay
-            cloud_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-            cloud_surface.fill(GRAY)
-            cloud_surface.set_alpha(30)
-            screen.blit(cloud_surface, (0, 0))
+            screen.blit(self.cloud_overlay, (0, 0))
 
 class DayNightCycle:
     def __init__(self):
         self.time_of_day = 0.5  # 0 = midnight, 0.5 = noon, 1.0 = midnight
         self.day_length = 600  # 10 minutes per full day
+        # Darkness overlay, filled once; only its alpha changes per frame
+        self.overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        self.overlay.fill((0, 0, 50))
+        # Darkness for the current time of day, refreshed by update; 0 through the whole day
+        self.overlay_alpha = self.get_lighting_alpha()
+        self.overlay.set_alpha(self.overlay_alpha)
         
     def update(self, dt: float):
         """Update day/night cycle"""
         self.time_of_day += dt / self.day_length
         if self.time_of_day >= 1.0:
             self.time_of_day = 0.0
+        alpha = self.get_lighting_alpha()
+        if alpha != self.overlay_alpha:
+            self.overlay_alpha = alpha
+            self.overlay.set_alpha(alpha)
             
     def get_lighting_alpha(self) -> int:
         """Get darkness overlay alpha based on time of day"""
@@ -444,214 +755,265 @@ class DayNightCycle:
         return int(darkness * 255)
         
     def draw_overlay(self, screen: pygame.Surface):
-        """Draw day/night lighting overlay"""
-        alpha = self.get_lighting_alpha()
-        if alpha > 0:
-            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-            overlay.fill((0, 0, 50))
-            overlay.set_alpha(alpha)
-            screen.blit(overlay, (0, 0))
+        """Draw day/night lighting overlay; callers skip it while overlay_alpha is 0"""
+        screen.blit(self.overlay, (0, 0))
 
 class Map:
     def __init__(self):
         self.width = MAP_WIDTH
         self.height = MAP_HEIGHT
-        self.tiles = self.generate_map()
+        # Tiles in one flat buffer, indexed by y * width + x
+        self.tiles_flat = self.generate_map()
+        # 1 where plants can grow (grass or soil), 0 elsewhere, laid out like tiles_flat
+        self.tillable_mask = bytearray(tile_type in (SOIL, GRASS) for tile_type in self.tiles_flat)
         self.sell_area = (self.width // 2, self.height // 2)  # Center of map
-        # Color variations for tiles with slow cycling
-        self.tile_colors = {}
+        # Color variations for tiles with slow cycling, indexed by y * width + x
+        self.tile_palettes: List[Optional[tuple]] = [None] * (self.width * self.height)
+        self.tile_phases = array.array('H', bytes(2 * self.width * self.height))
         self.init_tile_colors()
+        # Animation phases, advanced by update_animation
+        self.animation_tick = None
+        self.cycle_index = 0
+        self.water_index = 0
+        self.sell_color = (255, 215, 0)
+        # Whole map rendered at one pixel per tile, scaled up to TILE_SIZE when drawn
+        self.background = pygame.Surface((self.width, self.height)).convert()
+        self.render_background(0, 0, self.width, self.height, pygame.time.get_ticks())
+        self.frame_count = 0
+        # Visible window of the background, in tiles, and the screen-sized surface it is scaled into
+        self.view_width = min(self.width, SCREEN_WIDTH // TILE_SIZE + 2)
+        self.view_height = min(self.height, SCREEN_HEIGHT // TILE_SIZE + 2)
+        self.view_surface = pygame.Surface((self.view_width * TILE_SIZE, self.view_height * TILE_SIZE)).convert()
+        self.sell_tiles = [(index % self.width, index // self.width)
+                           for index, tile_type in enumerate(self.tiles_flat) if tile_type == SELL_AREA]
         
     def init_tile_colors(self):
         """Initialize random colors for each tile"""
-        for y in range(self.height):
-            for x in range(self.width):
-                tile_type = self.tiles[y][x]
-                if tile_type in ['grass', 'soil', 'stone']:
-                    # Create a unique seed for each tile for consistent randomness
-                    tile_seed = x * 1000 + y
-                    random.seed(tile_seed)
-                    
-                    if tile_type == 'grass':
-                        base_color = GREEN
-                        # Generate random variation within green range
-                        variation = random.randint(-30, 30)
-                        color = tuple(max(0, min(255, c + variation)) for c in base_color)
-                    elif tile_type == 'soil':
-                        base_color = SOIL_COLOR
-                        variation = random.randint(-20, 20)
-                        color = tuple(max(0, min(255, c + variation)) for c in base_color)
-                    elif tile_type == 'stone':
-                        base_color = GRAY
-                        variation = random.randint(-25, 25)
-                        color = tuple(max(0, min(255, c + variation)) for c in base_color)
-                    
-                    # Store initial phase for cycling
-                    phase = random.random() * 2 * math.pi
-                    self.tile_colors[(x, y)] = {'base_color': color, 'phase': phase}
-                    
-        # Reset random seed
-        random.seed()
+        # One palette per possible base color: (tile base color, max random variation)
+        variation_ranges = {GRASS: (GREEN, 30), SOIL: (SOIL_COLOR, 20), STONE: (GRAY, 25)}
+        palette_tables = {}
+        for tile_type, (base_color, spread) in variation_ranges.items():
+            palette_tables[tile_type] = [
+                self.build_cycle_palette(tuple(max(0, min(255, c + variation)) for c in base_color))
+                for variation in range(-spread, spread + 1)
+            ]
         
-    def get_tile_color(self, x: int, y: int, current_time: float) -> tuple:
+        # Fixed seed for consistent randomness, on a private generator so the global one is untouched
+        rng = random.Random(0)
+        for index, tile_type in enumerate(self.tiles_flat):
+            if tile_type in variation_ranges:
+                spread = variation_ranges[tile_type][1]
+                self.tile_palettes[index] = palette_tables[tile_type][rng.randint(0, 2 * spread)]
+                # Initial phase (in sine LUT steps) for cycling
+                self.tile_phases[index] = rng.randrange(SIN_LUT_SIZE)
+        
+    def build_cycle_palette(self, base_color: tuple) -> tuple:
+        """Precompute the colors a cycling tile steps through, one per brightness level"""
+        palette = []
+        for level in range(TILE_CYCLE_LEVELS):
+            # Offset at the middle of this level's slice of the sine wave
+            offset = ((level + 0.5) / TILE_CYCLE_LEVELS * 2 - 1) * TILE_CYCLE_AMPLITUDE
+            palette.append(tuple(max(0, min(255, int(c + offset))) for c in base_color))
+        return tuple(palette)
+        
+    def update_animation(self, ticks: int):
+        """Advance the tile animation phases to the given pygame tick"""
+        if ticks == self.animation_tick:
+            return
+        self.animation_tick = ticks
+        self.cycle_index = (ticks * TILE_CYCLE_TICK_STEP) >> 16
+        self.water_index = (ticks * WATER_WAVE_TICK_STEP) >> 16
+        glow = int(20 * SIN_LUT[((ticks * SELL_GLOW_TICK_STEP) >> 16) & SIN_LUT_MASK])
+        self.sell_color = (255, 215 + glow, 0)
+        
+    def get_tile_color(self, x: int, y: int, ticks: int) -> tuple:
         """Get current color for a tile with 2x faster cycling"""
-        tile_type = self.tiles[y][x]
-        
-        if tile_type == 'water':
-            # Animated water - 2x faster
-            wave = int(10 * math.sin(current_time * 4 + x * 0.3 + y * 0.3))  # Changed from *2 to *4
-            return (64 + wave, 164 + wave//2, 223)
-        elif tile_type == 'sell_area':
-            # Golden selling area - 2x faster
-            glow = int(20 * math.sin(current_time * 6))  # Changed from *3 to *6
-            return (255, 215 + glow, 0)
-        elif (x, y) in self.tile_colors:
-            # Cycling color for grass, soil, stone - 2x faster
-            color_info = self.tile_colors[(x, y)]
-            base_color = color_info['base_color']
-            phase = color_info['phase']
-            
-            # 2x faster color cycling
-            cycle_speed = 0.2  # Changed from 0.1 to 0.2 (2x faster)
-            cycle_offset = math.sin(current_time * cycle_speed + phase) * 15  # Small variation
-            
-            # Apply cycling to each color channel
-            new_color = []
-            for c in base_color:
-                new_c = c + cycle_offset
-                new_color.append(max(0, min(255, int(new_c))))
-            
-            return tuple(new_color)
+        self.update_animation(ticks)
+        index = y * self.width + x
+        tile_type = self.tiles_flat[index]
+        
+        if tile_type == WATER:
+            # Animated water
+            return WATER_COLOR_LUT[(self.water_index + (x + y) * WATER_PHASE_STEP) & SIN_LUT_MASK]
+        elif tile_type == SELL_AREA:
+            # Golden selling area
+            return self.sell_color
+        elif self.tile_palettes[index] is not None:
+            # Cycling color for grass, soil, stone, stepped through the tile's palette
+            level = TILE_CYCLE_LEVEL_LUT[(self.cycle_index + self.tile_phases[index]) & SIN_LUT_MASK]
+            return self.tile_palettes[index][level]
         else:
             # Default colors for tiles without cycling
-            if tile_type == 'grass':
+            if tile_type == GRASS:
                 return GREEN
-            elif tile_type == 'soil':
+            elif tile_type == SOIL:
                 return SOIL_COLOR
-            elif tile_type == 'stone':
+            elif tile_type == STONE:
                 return GRAY
             
         return WHITE  # Fallback
         
-    def generate_map(self) -> List[List[str]]:
-        """Generate a smooth, varied map"""
-        tiles = []
+    def generate_map(self) -> bytearray:
+        """Generate a smooth, varied map as one flat row-major buffer"""
+        tiles = bytearray()
         center_x, center_y = MAP_WIDTH // 2, MAP_HEIGHT // 2
         
+        # Noise terms depend on x, y or x + y alone, so precompute them per column, row and diagonal
+        column_noise = [math.sin(x * 0.1) for x in range(self.width)]
+        row_noise = [math.cos(y * 0.1) for y in range(self.height)]
+        diagonal_noise = [math.sin(d * 0.05) for d in range(self.width + self.height - 1)]
+        
         for y in range(self.height):
-            row = []
+            y_noise = row_noise[y]
             for x in range(self.width):
-                # Distance from center
-                dist_from_center = math.sqrt((x - center_x)**2 + (y - center_y)**2)
-                
                 # Create water border
                 if x < 8 or x >= self.width - 8 or y < 8 or y >= self.height - 8:
-                    row.append('water')
+                    tiles.append(WATER)
                 # Selling area at center
                 elif abs(x - center_x) <= 2 and abs(y - center_y) <= 2:
-                    row.append('sell_area')
+                    tiles.append(SELL_AREA)
                 # Use noise for terrain variation
                 else:
-                    noise_val = (math.sin(x * 0.1) + math.cos(y * 0.1) + 
-                               math.sin(x * 0.05 + y * 0.05)) / 3
+                    noise_val = (column_noise[x] + y_noise + diagonal_noise[x + y]) / 3
                     
                     if noise_val < -0.3:
-                        row.append('water')
+                        tiles.append(WATER)
                     elif noise_val < 0.1:
-                        row.append('soil')
+                        tiles.append(SOIL)
                     elif noise_val < 0.5:
-                        row.append('grass')
+                        tiles.append(GRASS)
                     else:
-                        row.append('stone')
+                        tiles.append(STONE)
                         
-            tiles.append(row)
         return tiles
         
+    def tile_at(self, x: int, y: int) -> int:
+        """Get the tile type at an in-bounds tile position"""
+        return self.tiles_flat[y * self.width + x]
+        
     def is_walkable(self, x: int, y: int) -> bool:
         """Check if a tile is walkable"""
         if x < 0 or x >= self.width or y < 0 or y >= self.height:
             return False
-        return self.tiles[y][x] != 'water'
+        return self.tiles_flat[y * self.width + x] != WATER
         
     def is_tillable(self, x: int, y: int) -> bool:
         """Check if a tile can be planted on"""
         if x < 0 or x >= self.width or y < 0 or y >= self.height:
             return False
-        return self.tiles[y][x] in ['soil', 'grass']
+        return self.tiles_flat[y * self.width + x] in (SOIL, GRASS)
         
     def is_sell_area(self, x: int, y: int) -> bool:
         """Check if player is in selling area"""
-        return self.tiles[y][x] == 'sell_area'
+        return self.tiles_flat[y * self.width + x] == SELL_AREA
+        
+    def render_background(self, start_x: int, start_y: int, end_x: int, end_y: int, ticks: int):
+        """Recolor a range of tiles in the background surface"""
+        background = self.background
+        background.lock()
+        for y in range(start_y, end_y):
+            for x in range(start_x, end_x):
+                background.set_at((x, y), self.get_tile_color(x, y, ticks))
+        background.unlock()
         
     def draw(self, screen: pygame.Surface, camera_x: int, camera_y: int):
         """Draw the map with cycling colors"""
-        current_time = time.time()
+        ticks = pygame.time.get_ticks()
         
         # Calculate visible tile range
-        start_x = max(0, camera_x // TILE_SIZE - 1)
-        start_y = max(0, camera_y // TILE_SIZE - 1)
-        end_x = min(self.width, (camera_x + SCREEN_WIDTH) // TILE_SIZE + 2)
-        end_y = min(self.height, (camera_y + SCREEN_HEIGHT) // TILE_SIZE + 2)
-        
-        for y in range(start_y, end_y):
-            for x in range(start_x, end_x):
+        start_x = max(0, min(self.width - self.view_width, camera_x // TILE_SIZE))
+        start_y = max(0, min(self.height - self.view_height, camera_y // TILE_SIZE))
+        end_x = start_x + self.view_width
+        end_y = start_y + self.view_height
+        
+        # Colors cycle slowly, so only recolor the visible tiles every few frames
+        if self.frame_count % TILE_ANIMATION_STRIDE == 0:
+            self.render_background(start_x, start_y, end_x, end_y, ticks)
+        self.frame_count += 1
+        
+        # Scale the visible tiles up in one C-level pass and blit them
+        view_rect = pygame.Rect(start_x, start_y, self.view_width, self.view_height)
+        pygame.transform.scale(self.background.subsurface(view_rect), self.view_surface.get_size(), self.view_surface)
+        screen.blit(self.view_surface, (start_x * TILE_SIZE - camera_x, start_y * TILE_SIZE - camera_y))
+        
+        # Add sparkle effect for sell area
+        for x, y in self.sell_tiles:
+            if start_x <= x < end_x and start_y <= y < end_y and random.random() < 0.1:
                 screen_x = x * TILE_SIZE - camera_x
                 screen_y = y * TILE_SIZE - camera_y
-                rect = pygame.Rect(screen_x, screen_y, TILE_SIZE, TILE_SIZE)
-                
-                color = self.get_tile_color(x, y, current_time)
-                pygame.draw.rect(screen, color, rect)
-                
-                # Add sparkle effect for sell area
-                if self.tiles[y][x] == 'sell_area' and random.random() < 0.1:
-                    sparkle_x = screen_x + random.randint(5, TILE_SIZE - 5)
-                    sparkle_y = screen_y + random.randint(5, TILE_SIZE - 5)
-                    pygame.draw.circle(screen, WHITE, (sparkle_x, sparkle_y), 2)
+                sparkle_x = screen_x + random.randint(5, TILE_SIZE - 5)
+                sparkle_y = screen_y + random.randint(5, TILE_SIZE - 5)
+                pygame.draw.circle(screen, WHITE, (sparkle_x, sparkle_y), 2)
 
 class Minimap:
     def __init__(self, map_obj: Map):
         self.map = map_obj
         self.size = 200
         self.scale = self.size / max(MAP_WIDTH, MAP_HEIGHT)
-        
-    def draw(self, screen: pygame.Surface, player_x: int, player_y: int):
-        """Draw the minimap"""
-        # Minimap background
-        minimap_rect = pygame.Rect(SCREEN_WIDTH - self.size - 20, 20, self.size, self.size)
-        pygame.draw.rect(screen, WHITE, minimap_rect)
-        pygame.draw.rect(screen, BLACK, minimap_rect, 2)
-        
-        # Draw simplified map
-        for y in range(0, MAP_HEIGHT, 4):  # Sample every 4th tile for performance
+        self.base = self.render_base()
+        self.rect = pygame.Rect(SCREEN_WIDTH - self.size - 20, 20, self.size, self.size)
+        # Terrain with the player marker on top, redrawn only when the marker moves
+        self.composite = self.base.copy()
+        self.marker_pos: Optional[Tuple[int, int]] = None
+        
+    def render_base(self) -> pygame.Surface:
+        """Render the simplified map once; terrain never changes"""
+        base = pygame.Surface((self.size, self.size))
+        base.fill(WHITE)
+        pygame.draw.rect(base, BLACK, base.get_rect(), 2)
+        
+        for y in range(0, MAP_HEIGHT, 4):  # Sample every 4th tile
             for x in range(0, MAP_WIDTH, 4):
-                tile_type = self.map.tiles[y][x]
-                mini_x = minimap_rect.x + x * self.scale
-                mini_y = minimap_rect.y + y * self.scale
+                tile_type = self.map.tile_at(x, y)
+                mini_x = x * self.scale
+                mini_y = y * self.scale
                 mini_size = max(1, int(4 * self.scale))
                 
                 color = WHITE
-                if tile_type == 'water':
+                if tile_type == WATER:
                     color = WATER_COLOR
-                elif tile_type == 'soil':
+                elif tile_type == SOIL:
                     color = SOIL_COLOR
-                elif tile_type == 'grass':
+                elif tile_type == GRASS:
                     color = GREEN
-                elif tile_type == 'stone':
+                elif tile_type == STONE:
                     color = GRAY
-                elif tile_type == 'sell_area':
+                elif tile_type == SELL_AREA:
                     color = YELLOW
                     
-                pygame.draw.rect(screen, color, (mini_x, mini_y, mini_size, mini_size))
+                pygame.draw.rect(base, color, (mini_x, mini_y, mini_size, mini_size))
+        
+        return base.convert()
         
-        # Draw player position
-        player_mini_x = minimap_rect.x + (player_x // TILE_SIZE) * self.scale
-        player_mini_y = minimap_rect.y + (player_y // TILE_SIZE) * self.scale
-        pygame.draw.circle(screen, RED, (int(player_mini_x), int(player_mini_y)), 4)
-        pygame.draw.circle(screen, WHITE, (int(player_mini_x), int(player_mini_y)), 2)
+    def draw(self, screen: pygame.Surface, player_x: int, player_y: int):
+        """Draw the minimap"""
+        # Player position, relative to the minimap; it moves only every few tiles
+        marker_pos = (int((player_x // TILE_SIZE) * self.scale), int((player_y // TILE_SIZE) * self.scale))
+        if marker_pos != self.marker_pos:
+            self.marker_pos = marker_pos
+            self.composite.blit(self.base, (0, 0))
+            pygame.draw.circle(self.composite, RED, marker_pos, 4)
+            pygame.draw.circle(self.composite, WHITE, marker_pos, 2)
+        screen.blit(self.composite, self.rect)
 
 class HelpDialog:
     def __init__(self):
         self.is_open = False
+        # Help dialog box - increased height
+        dialog_width = 800
+        dialog_height = 700  # Increased from 600 to 700
+        self.dialog_rect = pygame.Rect(
+            (SCREEN_WIDTH - dialog_width) // 2,
+            (SCREEN_HEIGHT - dialog_height) // 2 - 30,  # Moved up by 30 pixels
+            dialog_width,
+            dialog_height
+        )
+        self.cached = None  # Static dialog contents, rendered on first draw
+        self.cached_fonts = None  # Fonts the cached contents were rendered with
+        # Semi-transparent overlay, filled once
+        self.overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        self.overlay.fill(BLACK)
+        self.overlay.set_alpha(128)
         
     def toggle(self):
         """Toggle help dialog open/closed"""
@@ -661,34 +1023,18 @@ class HelpDialog:
         """Close help dialog"""
         self.is_open = False
         
-    def draw(self, screen: pygame.Surface, font, small_font):
-        """Draw help dialog when open"""
-        if not self.is_open:
-            return
-            
-        # Semi-transparent overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.fill(BLACK)
-        overlay.set_alpha(128)
-        screen.blit(overlay, (0, 0))
+    def render_dialog(self, font, small_font) -> pygame.Surface:
+        """Render the dialog box, title and help text once"""
+        dialog = pygame.Surface(self.dialog_rect.size).convert()
+        dialog_rect = dialog.get_rect()
         
-        # Help dialog box - increased height
-        dialog_width = 800
-        dialog_height = 700  # Increased from 600 to 700
-        dialog_rect = pygame.Rect(
-            (SCREEN_WIDTH - dialog_width) // 2,
-            (SCREEN_HEIGHT - dialog_height) // 2 - 30,  # Moved up by 30 pixels
-            dialog_width,
-            dialog_height
-        )
-        
-        pygame.draw.rect(screen, WHITE, dialog_rect)
-        pygame.draw.rect(screen, BLACK, dialog_rect, 4)
+        dialog.fill(WHITE)
+        pygame.draw.rect(dialog, BLACK, dialog_rect, 4)
         
         # Title
         title_text = font.render("HELP & CONTROLS", True, BLACK)
         title_rect = title_text.get_rect(centerx=dialog_rect.centerx, y=dialog_rect.y + 20)
-        screen.blit(title_text, title_rect)
+        dialog.blit(title_text, title_rect)
         
         # Help content
         help_sections = [
@@ -725,13 +1071,13 @@ class HelpDialog:
         for section_title, items in help_sections:
             # Section title
             section_surface = small_font.render(section_title, True, DARK_BLUE)
-            screen.blit(section_surface, (dialog_rect.x + 30, dialog_rect.y + y_offset))
+            dialog.blit(section_surface, (dialog_rect.x + 30, dialog_rect.y + y_offset))
             y_offset += 30
             
             # Section items
             for item in items:
                 item_surface = small_font.render(f"  • {item}", True, BLACK)
-                screen.blit(item_surface, (dialog_rect.x + 40, dialog_rect.y + y_offset))
+                dialog.blit(item_surface, (dialog_rect.x + 40, dialog_rect.y + y_offset))
                 y_offset += 22
             
             y_offset += 10  # Extra space between sections
@@ -739,17 +1085,200 @@ class HelpDialog:
         # Close instruction
         close_text = font.render("Press ESC to close this help dialog", True, RED)
         close_rect = close_text.get_rect(centerx=dialog_rect.centerx, y=dialog_rect.bottom - 40)
-        screen.blit(close_text, close_rect)
+        dialog.blit(close_text, close_rect)
+        return dialog
+        
+    def draw(self, screen: pygame.Surface, font, small_font):
+        """Draw help dialog when open"""
+        if not self.is_open:
+            return
+            
+        # Semi-transparent overlay
+        screen.blit(self.overlay, (0, 0))
+        
+        if self.cached is None or self.cached_fonts != (font, small_font):
+            self.cached = self.render_dialog(font, small_font)
+            self.cached_fonts = (font, small_font)
+        screen.blit(self.cached, self.dialog_rect)
+
+# Shop stock: (name, seed cost, growth time, color[, fruit color]) for each seed category
+COMMON_PLANT_DATA = (
+    ('Radish', 1.0, 5, (255, 100, 100)),
+    ('Lettuce', 2.0, 6, (100, 255, 100)),
+    ('Spinach', 3.0, 4, (50, 200, 50)),
+    ('Herbs', 5.0, 7, (100, 150, 50)),
+    ('Green Onion', 8.0, 8, (200, 255, 200)),
+    ('Carrot', 15.0, 15, (255, 140, 0)),
+    ('Tomato', 20.0, 20, (255, 0, 0), (255, 50, 50)),
+    ('Potato', 25, 25, (160, 82, 45)),
+    ('Corn', 30, 30, (255, 255, 0), (255, 255, 100)),
+    ('Broccoli', 35, 35, (0, 128, 0)),
+    ('Cabbage', 40, 40, (100, 200, 100)),
+    ('Pepper', 50, 45, (255, 100, 0), (255, 0, 0)),
+    ('Cucumber', 60, 50, (0, 255, 100)),
+    ('Eggplant', 80, 60, (128, 0, 128)),
+    ('Sunflower', 100, 70, (255, 255, 0), (255, 215, 0)),
+    ('Pumpkin', 120, 80, (255, 165, 0)),
+    ('Strawberry', 150, 90, (255, 192, 203), (255, 0, 100)),
+    ('Blueberry', 180, 100, (100, 149, 237), (0, 0, 255)),
+    ('Apple Tree', 200, 120, (139, 69, 19), (255, 0, 0)),
+    ('Orange Tree', 250, 140, (139, 69, 19), (255, 165, 0)),
+    ('Cherry Tree', 280, 160, (139, 69, 19), (255, 20, 147)),
+    ('Peach Tree', 300, 180, (139, 69, 19), (255, 218, 185)),
+    ('Pear Tree', 320, 200, (139, 69, 19), (255, 255, 0)),
+    ('Grape Vine', 350, 220, (128, 0, 128), (148, 0, 211)),
+    ('Avocado Tree', 380, 240, (139, 69, 19), (107, 142, 35)),
+    ('Mango Tree', 400, 260, (139, 69, 19), (255, 165, 0)),
+    ('Coconut Palm', 420, 280, (139, 69, 19), (139, 69, 19)),
+    ('Lemon Tree', 450, 300, (139, 69, 19), (255, 255, 0)),
+    ('Lime Tree', 480, 320, (139, 69, 19), (0, 255, 0)),
+    ('Banana Tree', 500, 340, (139, 69, 19), (255, 255, 0))
+)
+
+RARE_PLANT_DATA = (
+    ('Dragon Fruit', 500, 360, (255, 20, 147), (255, 192, 203)),
+    ('Golden Apple', 750, 420, (255, 215, 0), (255, 223, 0)),
+    ('Rainbow Rose', 1000, 480, (255, 105, 180), (255, 20, 147)),
+    ('Crystal Lotus', 1250, 540, (224, 255, 255), (173, 216, 230)),
+    ('Starfruit', 1500, 600, (255, 255, 0), (255, 215, 0)),
+    ('Phoenix Flower', 1750, 660, (255, 69, 0), (255, 140, 0)),
+    ('Moonberry', 2000, 720, (230, 230, 250), (147, 112, 219)),
+    ('Thunder Melon', 2250, 780, (255, 0, 255), (138, 43, 226)),
+    ('Ice Mint', 2500, 840, (173, 216, 230), (224, 255, 255)),
+    ('Fire Pepper', 2750, 900, (255, 69, 0), (255, 0, 0)),
+    ('Wind Blossom', 3000, 960, (144, 238, 144), (0, 255, 127)),
+    ('Solar Orchid', 3250, 1020, (255, 215, 0), (255, 255, 0)),
+    ('Storm Lily', 3500, 1080, (75, 0, 130), (147, 112, 219)),
+    ('Earth Root', 3750, 1140, (139, 69, 19), (160, 82, 45)),
+    ('Void Berry', 4000, 1200, (25, 25, 112), (72, 61, 139)),
+    ('Light Sage', 4250, 1260, (255, 255, 224), (255, 255, 255)),
+    ('Shadow Thorn', 4500, 1320, (47, 79, 79), (0, 0, 0)),
+    ('Time Blossom', 4750, 1380, (255, 20, 147), (255, 105, 180)),
+    ('Space Fruit', 5000, 1440, (25, 25, 112), (65, 105, 225))
+)
+RARE_PLANT_SIZES = ((3, 3), (2, 1), (3, 2), (3, 1))
+
+MYTHIC_PLANT_DATA = (
+    ('Eternal Fruit', 5000, 1800, (255, 215, 0), (255, 223, 0)),
+    ('Mystic Herb', 10000, 2400, (138, 43, 226), (147, 112, 219)),
+    ('Cosmic Berry', 15000, 3000, (75, 0, 130), (123, 104, 238)),
+    ('Divine Rose', 20000, 3600, (255, 20, 147), (255, 182, 193)),
+    ('Celestial Apple', 25000, 4200, (255, 215, 0), (255, 255, 224)),
+    ('Quantum Melon', 30000, 4800, (0, 255, 255), (224, 255, 255)),
+    ('Infinity Bloom', 35000, 5400, (255, 105, 180), (255, 20, 147)),
+    ('Galaxy Grape', 40000, 6000, (75, 0, 130), (138, 43, 226)),
+    ('Universe Berry', 45000, 6600, (25, 25, 112), (72, 61, 139)),
+    ('Reality Stone Fruit', 50000, 7200, (255, 0, 0), (220, 20, 60)),
+    ('Time Crystal Plant', 55000, 7800, (173, 216, 230), (224, 255, 255)),
+    ('Power Gem Flower', 60000, 8400, (255, 165, 0), (255, 215, 0)),
+    ('Mind Stone Herb', 65000, 9000, (138, 43, 226), (147, 112, 219)),
+    ('Soul Stone Berry', 70000, 9600, (255, 140, 0), (255, 165, 0)),
+    ('Space Stone Vine', 75000, 10200, (0, 0, 255), (65, 105, 225)),
+    ('Dimensional Fruit', 80000, 10800, (255, 20, 147), (255, 105, 180)),
+    ('Multiverse Bloom', 85000, 11400, (255, 215, 0), (255, 255, 0)),
+    ('Omniversal Plant', 90000, 12000, (255, 255, 255), (224, 255, 255)),
+    ('Creator Seed', 95000, 12600, (255, 215, 0), (255, 223, 0)),
+    ('God Tier Fruit', 100000, 13200, (255, 215, 0), (255, 255, 224))
+)
+MYTHIC_PLANT_SIZES = ((1, 1), (2, 1), (1, 2), (2, 2), (3, 1), (1, 3), (3, 3), (4, 3), (3, 4))  # No 4x4
+
+LEGENDARY_PLANT_DATA = (
+    ('World Tree Sapling', 200000, 14400, (139, 69, 19), (0, 255, 0)),
+    ('Universe Heart', 1000000, 25600, (255, 20, 147), (255, 105, 180)),
+    ('Infinity Garden', 3000000, 106800, (255, 215, 0), (255, 255, 0)),
+    ('Creation Essence', 5000000, 280000, (255, 255, 255), (224, 255, 255)),
+    ('Omnipotent Bloom', 10000000, 1900200, (255, 215, 0), (255, 223, 0))
+)
+
+# Tools for sale: (name, cost, color)
+TOOL_DATA = (
+    ('Iron Fertilizer', 10000, (128, 128, 128)),
+    ('Gold Fertilizer', 150000, (255, 215, 0)),
+    ('Diamond Fertilizer', 2500000, (185, 242, 255)),
+    ('Iron Hoe', 5000, (128, 128, 128)),
+    ('Gold Hoe', 50000, (255, 215, 0)),
+    ('Diamond Hoe', 250000, (185, 242, 255)),
+    ('Iron Shovel', 20000, (128, 128, 128)),
+    ('Gold Shovel', 100000, (255, 215, 0)),
+    ('Diamond Shovel', 500000, (185, 242, 255))
+)
+TOOL_LEVEL_MAP = {'Iron': 1, 'Gold': 2, 'Diamond': 3}  # Upgrade level granted by each tool material
 
 class Shop:
+    # Sell price for each seed cost, tuned by hand
+    _SELL_TABLE = {
+        1.00: 1.01, 2.00: 2.06, 3.00: 3.10, 5.00: 6.30,
+        8.00: 11.00, 15.00: 26.00, 20.00: 32.00, 25.00: 40.00,
+        30.00: 40.00, 35.00: 55.00, 40.00: 52.00, 50.00: 68.00,
+        60.00: 68.00, 80.00: 120.00, 100.00: 130.00, 120.00: 228.00,
+        150.00: 250.00, 180.00: 240.00, 200.00: 320.00, 250.00: 411.00,
+        280.00: 515.00, 300.00: 570.00, 320.00: 614.00, 350.00: 676.00,
+        380.00: 737.00, 400.00: 780.00, 420.00: 882.00, 450.00: 945.00,
+        480.00: 1027.00, 500.00: 1090.00, 750.00: 1725.00, 1000.00: 2350.00,
+        1250.00: 3063.00, 1500.00: 3720.00, 1750.00: 4393.00, 2000.00: 5000.00,
+        2250.00: 5648.00, 2500.00: 6425.00, 2750.00: 7233.00, 3000.00: 7950.00,
+        3250.00: 8938.00, 3500.00: 9730.00, 3750.00: 10463.00, 4000.00: 11240.00,
+        4250.00: 11985.00, 4500.00: 12780.00, 4750.00: 13538.00, 5000.00: 14750.00,
+        10000.00: 30000.00, 15000.00: 45750.00, 20000.00: 68000.00, 25000.00: 90000.00,
+        30000.00: 113700.00, 35000.00: 136500.00, 40000.00: 160000.00, 45000.00: 184500.00,
+        50000.00: 210000.00, 55000.00: 236500.00, 60000.00: 261000.00, 65000.00: 284050.00,
+        70000.00: 308000.00, 75000.00: 331500.00, 80000.00: 355200.00, 85000.00: 379100.00,
+        90000.00: 403200.00, 95000.00: 427500.00, 100000.00: 451000.00, 200000.00: 1200000.00,
+        1000000.00: 7000000.00, 3000000.00: 25500000.00, 5000000.00: 500000000.00, 10000000.00: 12000000000.00
+    }
+
     def __init__(self):
         self.plant_categories = self.create_plant_categories()
+        # Categories never change after creation, so merge them once
+        self._all_plants: Dict[str, PlantType] = {}
+        for category in self.plant_categories:
+            self._all_plants.update(category['plants'])
+        # Sell value per item id, 0 for anything the shop doesn't sell
+        self._sell_values = [0.0] * len(ITEM_NAMES)
+        for plant_type in self._all_plants.values():
+            self._sell_values[plant_type.item_id] = plant_type.sell_value
         self.is_open = False
         self.current_page = 0
         self.max_page = len(self.plant_categories) - 1
         self.buy_buttons = []  # Initialize buy buttons list
         self.nav_buttons = []  # Initialize navigation buttons list
         
+        # The shop layout never changes, so its rects are built once and reused every frame
+        original_width = SCREEN_WIDTH - 200
+        shop_width = int(original_width * 0.75)  # 0.75x width
+        self.shop_rect = pygame.Rect((SCREEN_WIDTH - shop_width) // 2, 80, shop_width, SCREEN_HEIGHT - 160)
+        self.row_y_offset = 70
+        self.row_height = 35
+        # Only rows starting at least 100px above the shop bottom fit in the shop area
+        self.max_visible_rows = (self.shop_rect.height - 100 - self.row_y_offset) // self.row_height + 1
+        self.button_rects = [
+            pygame.Rect(self.shop_rect.right - 120, self.shop_rect.y + self.row_y_offset + i * self.row_height - 5, 80, 25)
+            for i in range(self.max_visible_rows)
+        ]
+        # Bounding box of the button column, so clicks elsewhere skip the per-row test
+        self.buttons_bbox = self.button_rects[0].unionall(self.button_rects)
+        # Buy button backgrounds with their border baked in, keyed by fill color
+        self.button_surfaces: Dict[tuple, pygame.Surface] = {}
+        for button_color in (GREEN, GRAY):
+            button_surface = pygame.Surface(self.button_rects[0].size).convert()
+            button_surface.fill(button_color)
+            pygame.draw.rect(button_surface, BLACK, button_surface.get_rect(), 2)
+            self.button_surfaces[button_color] = button_surface
+        # The (name, plant type) rows shown on each page, cut to the rows that fit
+        self._page_items = [tuple(islice(category['plants'].items(), self.max_visible_rows))
+                            for category in self.plant_categories]
+        # Navigation triangles at bottom with increased spacing
+        centerx = self.shop_rect.centerx
+        self.nav_y = self.shop_rect.bottom - 40
+        self.prev_points = ((centerx - 100, self.nav_y), (centerx - 80, self.nav_y - 15), (centerx - 80, self.nav_y + 15))
+        self.next_points = ((centerx + 100, self.nav_y), (centerx + 80, self.nav_y - 15), (centerx + 80, self.nav_y + 15))
+        self.prev_rect = pygame.Rect(centerx - 100, self.nav_y - 15, 20, 30)
+        self.next_rect = pygame.Rect(centerx + 80, self.nav_y - 15, 20, 30)
+        # Rendered shop row texts and button labels, for the font they were rendered with
+        self._text_font = None
+        self._row_text_cache: Dict[Tuple[str, str, tuple], pygame.Surface] = {}
+        self._label_cache: Dict[str, Tuple[pygame.Surface, Tuple[int, int]]] = {}
+        
     def calculate_sell_value(self, seed_cost: float, growth_time: float) -> float:
         """Calculate sell value proportional to wait time"""
         # Base multiplier: sell price = seed_cost * (1 + growth_time_minutes * 0.1)
@@ -761,36 +1290,7 @@ class Shop:
         #multiplier = 1 + (time_minutes * 0.1)
         #return seed_cost * multiplier
 
-        # New code
-
-        keys = [
-            1.00, 2.00, 3.00, 5.00, 8.00, 15.00, 20.00, 25.00, 30.00, 35.00, 40.00, 50.00,
-            60.00, 80.00, 100.00, 120.00, 150.00, 180.00, 200.00, 250.00, 280.00, 300.00,
-            320.00, 350.00, 380.00, 400.00, 420.00, 450.00, 480.00, 500.00, 500.00, 750.00,
-            1000.00, 1250.00, 1500.00, 1750.00, 2000.00, 2250.00, 2500.00, 2750.00, 3000.00,
-            3250.00, 3500.00, 3750.00, 4000.00, 4250.00, 4500.00, 4750.00, 5000.00, 5000.00,
-            10000.00, 15000.00, 20000.00, 25000.00, 30000.00, 35000.00, 40000.00, 45000.00,
-            50000.00, 55000.00, 60000.00, 65000.00, 70000.00, 75000.00, 80000.00, 85000.00,
-            90000.00, 95000.00, 100000.00, 200000.00, 1000000.00, 3000000.00, 5000000.00, 10000000.00
-        ]
-
-        # Second set of values
-        values = [
-            1.01, 2.06, 3.10, 6.30, 11.00, 26.00, 32.00, 40.00, 40.00, 55.00, 52.00, 68.00,
-            68.00, 120.00, 130.00, 228.00, 250.00, 240.00, 320.00, 411.00, 515.00, 570.00,
-            614.00, 676.00, 737.00, 780.00, 882.00, 945.00, 1027.00, 1080.00, 1090.00, 1725.00,
-            2350.00, 3063.00, 3720.00, 4393.00, 5000.00, 5648.00, 6425.00, 7233.00, 7950.00,
-            8938.00, 9730.00, 10463.00, 11240.00, 11985.00, 12780.00, 13538.00, 14450.00,
-            14750.00, 30000.00, 45750.00, 68000.00, 90000.00, 113700.00, 136500.00, 160000.00,
-            184500.00, 210000.00, 236500.00, 261000.00, 284050.00, 308000.00, 331500.00,
-            355200.00, 379100.00, 403200.00, 427500.00, 451000.00, 1200000.00, 7000000.00,
-            25500000.00, 500000000.00, 12000000000.00
-        ]
-
-        # Create the library dictionary
-        library = dict(zip(keys, values))
-
-        return library.get(seed_cost)
+        return Shop._SELL_TABLE.get(float(seed_cost))
 
         
     def create_plant_categories(self) -> List[Dict]:
@@ -799,40 +1299,7 @@ class Shop:
         
         # Common Seeds ($1-$500) - All 1x1 with decimal prices for early crops
         common_plants = {}
-        plants_data = [
-            ('Radish', 1.0, 5, (255, 100, 100)),
-            ('Lettuce', 2.0, 6, (100, 255, 100)),
-            ('Spinach', 3.0, 4, (50, 200, 50)),
-            ('Herbs', 5.0, 7, (100, 150, 50)),
-            ('Green Onion', 8.0, 8, (200, 255, 200)),
-            ('Carrot', 15.0, 15, (255, 140, 0)),
-            ('Tomato', 20.0, 20, (255, 0, 0), (255, 50, 50)),
-            ('Potato', 25, 25, (160, 82, 45)),
-            ('Corn', 30, 30, (255, 255, 0), (255, 255, 100)),
-            ('Broccoli', 35, 35, (0, 128, 0)),
-            ('Cabbage', 40, 40, (100, 200, 100)),
-            ('Pepper', 50, 45, (255, 100, 0), (255, 0, 0)),
-            ('Cucumber', 60, 50, (0, 255, 100)),
-            ('Eggplant', 80, 60, (128, 0, 128)),
-            ('Sunflower', 100, 70, (255, 255, 0), (255, 215, 0)),
-            ('Pumpkin', 120, 80, (255, 165, 0)),
-            ('Strawberry', 150, 90, (255, 192, 203), (255, 0, 100)),
-            ('Blueberry', 180, 100, (100, 149, 237), (0, 0, 255)),
-            ('Apple Tree', 200, 120, (139, 69, 19), (255, 0, 0)),
-            ('Orange Tree', 250, 140, (139, 69, 19), (255, 165, 0)),
-            ('Cherry Tree', 280, 160, (139, 69, 19), (255, 20, 147)),
-            ('Peach Tree', 300, 180, (139, 69, 19), (255, 218, 185)),
-            ('Pear Tree', 320, 200, (139, 69, 19), (255, 255, 0)),
-            ('Grape Vine', 350, 220, (128, 0, 128), (148, 0, 211)),
-            ('Avocado Tree', 380, 240, (139, 69, 19), (107, 142, 35)),
-            ('Mango Tree', 400, 260, (139, 69, 19), (255, 165, 0)),
-            ('Coconut Palm', 420, 280, (139, 69, 19), (139, 69, 19)),
-            ('Lemon Tree', 450, 300, (139, 69, 19), (255, 255, 0)),
-            ('Lime Tree', 480, 320, (139, 69, 19), (0, 255, 0)),
-            ('Banana Tree', 500, 340, (139, 69, 19), (255, 255, 0))
-        ]
-        
-        for plant_data in plants_data:
+        for plant_data in COMMON_PLANT_DATA:
             name, cost, time, color = plant_data[:4]
             fruit_color = plant_data[4] if len(plant_data) > 4 else color
             sell_value = self.calculate_sell_value(cost, time)
@@ -847,34 +1314,12 @@ class Shop:
         
         # Rare Seeds ($500-$5000) - Can be 3x3, 2x1, 3x2, 3x1
         rare_plants = {}
-        rare_sizes = [(3, 3), (2, 1), (3, 2), (3, 1)]
-        rare_data = [
-            ('Dragon Fruit', 500, 360, (255, 20, 147), (255, 192, 203)),
-            ('Golden Apple', 750, 420, (255, 215, 0), (255, 223, 0)),
-            ('Rainbow Rose', 1000, 480, (255, 105, 180), (255, 20, 147)),
-            ('Crystal Lotus', 1250, 540, (224, 255, 255), (173, 216, 230)),
-            ('Starfruit', 1500, 600, (255, 255, 0), (255, 215, 0)),
-            ('Phoenix Flower', 1750, 660, (255, 69, 0), (255, 140, 0)),
-            ('Moonberry', 2000, 720, (230, 230, 250), (147, 112, 219)),
-            ('Thunder Melon', 2250, 780, (255, 0, 255), (138, 43, 226)),
-            ('Ice Mint', 2500, 840, (173, 216, 230), (224, 255, 255)),
-            ('Fire Pepper', 2750, 900, (255, 69, 0), (255, 0, 0)),
-            ('Wind Blossom', 3000, 960, (144, 238, 144), (0, 255, 127)),
-            ('Solar Orchid', 3250, 1020, (255, 215, 0), (255, 255, 0)),
-            ('Storm Lily', 3500, 1080, (75, 0, 130), (147, 112, 219)),
-            ('Earth Root', 3750, 1140, (139, 69, 19), (160, 82, 45)),
-            ('Void Berry', 4000, 1200, (25, 25, 112), (72, 61, 139)),
-            ('Light Sage', 4250, 1260, (255, 255, 224), (255, 255, 255)),
-            ('Shadow Thorn', 4500, 1320, (47, 79, 79), (0, 0, 0)),
-            ('Time Blossom', 4750, 1380, (255, 20, 147), (255, 105, 180)),
-            ('Space Fruit', 5000, 1440, (25, 25, 112), (65, 105, 225))
-        ]
-        
-        for i, plant_data in enumerate(rare_data):
+        rare_size_list = random.choices(RARE_PLANT_SIZES, k=len(RARE_PLANT_DATA))  # One random size per plant
+        for i, plant_data in enumerate(RARE_PLANT_DATA):
             name, cost, time, color = plant_data[:4]
             fruit_color = plant_data[4] if len(plant_data) > 4 else color
             sell_value = self.calculate_sell_value(cost, time)
-            size = random.choice(rare_sizes)
+            size = rare_size_list[i]
             rare_plants[name] = PlantType(name, cost, sell_value, time, color, fruit_color, size)
         
         categories.append({
@@ -885,35 +1330,12 @@ class Shop:
         
         # Mythic Seeds ($5000-$100000) - Anything except 4x4
         mythic_plants = {}
-        mythic_sizes = [(1, 1), (2, 1), (1, 2), (2, 2), (3, 1), (1, 3), (3, 3), (4, 3), (3, 4)]  # No 4x4
-        mythic_data = [
-            ('Eternal Fruit', 5000, 1800, (255, 215, 0), (255, 223, 0)),
-            ('Mystic Herb', 10000, 2400, (138, 43, 226), (147, 112, 219)),
-            ('Cosmic Berry', 15000, 3000, (75, 0, 130), (123, 104, 238)),
-            ('Divine Rose', 20000, 3600, (255, 20, 147), (255, 182, 193)),
-            ('Celestial Apple', 25000, 4200, (255, 215, 0), (255, 255, 224)),
-            ('Quantum Melon', 30000, 4800, (0, 255, 255), (224, 255, 255)),
-            ('Infinity Bloom', 35000, 5400, (255, 105, 180), (255, 20, 147)),
-            ('Galaxy Grape', 40000, 6000, (75, 0, 130), (138, 43, 226)),
-            ('Universe Berry', 45000, 6600, (25, 25, 112), (72, 61, 139)),
-            ('Reality Stone Fruit', 50000, 7200, (255, 0, 0), (220, 20, 60)),
-            ('Time Crystal Plant', 55000, 7800, (173, 216, 230), (224, 255, 255)),
-            ('Power Gem Flower', 60000, 8400, (255, 165, 0), (255, 215, 0)),
-            ('Mind Stone Herb', 65000, 9000, (138, 43, 226), (147, 112, 219)),
-            ('Soul Stone Berry', 70000, 9600, (255, 140, 0), (255, 165, 0)),
-            ('Space Stone Vine', 75000, 10200, (0, 0, 255), (65, 105, 225)),
-            ('Dimensional Fruit', 80000, 10800, (255, 20, 147), (255, 105, 180)),
-            ('Multiverse Bloom', 85000, 11400, (255, 215, 0), (255, 255, 0)),
-            ('Omniversal Plant', 90000, 12000, (255, 255, 255), (224, 255, 255)),
-            ('Creator Seed', 95000, 12600, (255, 215, 0), (255, 223, 0)),
-            ('God Tier Fruit', 100000, 13200, (255, 215, 0), (255, 255, 224))
-        ]
-        
-        for i, plant_data in enumerate(mythic_data):
+        mythic_size_list = random.choices(MYTHIC_PLANT_SIZES, k=len(MYTHIC_PLANT_DATA))  # One random size per plant
+        for i, plant_data in enumerate(MYTHIC_PLANT_DATA):
             name, cost, time, color = plant_data[:4]
             fruit_color = plant_data[4] if len(plant_data) > 4 else color
             sell_value = self.calculate_sell_value(cost, time)
-            size = random.choice(mythic_sizes)
+            size = mythic_size_list[i]
             mythic_plants[name] = PlantType(name, cost, sell_value, time, color, fruit_color, size)
         
         categories.append({
@@ -924,15 +1346,7 @@ class Shop:
         
         # Legendary Seeds ($200,000-$10,000,000) - All 4x4
         legendary_plants = {}
-        legendary_data = [
-            ('World Tree Sapling', 200000, 14400, (139, 69, 19), (0, 255, 0)),
-            ('Universe Heart', 1000000, 25600, (255, 20, 147), (255, 105, 180)),
-            ('Infinity Garden', 3000000, 106800, (255, 215, 0), (255, 255, 0)),
-            ('Creation Essence', 5000000, 280000, (255, 255, 255), (224, 255, 255)),
-            ('Omnipotent Bloom', 10000000, 1900200, (255, 215, 0), (255, 223, 0))
-        ]
-        
-        for i, plant_data in enumerate(legendary_data):
+        for i, plant_data in enumerate(LEGENDARY_PLANT_DATA):
             name, cost, time, color = plant_data[:4]
             fruit_color = plant_data[4] if len(plant_data) > 4 else color
             sell_value = self.calculate_sell_value(cost, time)
@@ -946,17 +1360,14 @@ class Shop:
         })
         
         # Tools category
-        tools = {
-            'Iron Fertilizer': PlantType('Iron Fertilizer', 10000, 0, 0, (128, 128, 128)),
-            'Gold Fertilizer': PlantType('Gold Fertilizer', 150000, 0, 0, (255, 215, 0)),
-            'Diamond Fertilizer': PlantType('Diamond Fertilizer', 2500000, 0, 0, (185, 242, 255)),
-            'Iron Hoe': PlantType('Iron Hoe', 5000, 0, 0, (128, 128, 128)),
-            'Gold Hoe': PlantType('Gold Hoe', 50000, 0, 0, (255, 215, 0)),
-            'Diamond Hoe': PlantType('Diamond Hoe', 250000, 0, 0, (185, 242, 255)),
-            'Iron Shovel': PlantType('Iron Shovel', 20000, 0, 0, (128, 128, 128)),
-            'Gold Shovel': PlantType('Gold Shovel', 100000, 0, 0, (255, 215, 0)),
-            'Diamond Shovel': PlantType('Diamond Shovel', 500000, 0, 0, (185, 242, 255))
-        }
+        tools = {name: PlantType(name, cost, 0, 0, color) for name, cost, color in TOOL_DATA}
+        
+        # Tag tools with their kind and level so buying and drawing need no name parsing
+        for tool_name, tool in tools.items():
+            level_name, kind_name = tool_name.split()
+            tool.tool_kind = kind_name.lower()
+            tool.tool_id = TOOL_KINDS.index(tool.tool_kind)
+            tool.tool_level = TOOL_LEVEL_MAP[level_name]
         
         categories.append({
             'name': 'TOOLS',
@@ -968,10 +1379,7 @@ class Shop:
         
     def get_all_plant_types(self) -> Dict[str, PlantType]:
         """Get all plant types from all categories"""
-        all_plants = {}
-        for category in self.plant_categories:
-            all_plants.update(category['plants'])
-        return all_plants
+        return self._all_plants
         
     def toggle_shop(self):
         """Toggle shop open/closed"""
@@ -989,59 +1397,44 @@ class Shop:
         
     def buy_seeds(self, player: Player, plant_name: str, quantity: int = 1) -> bool:
         """Buy seeds or tools if player has enough money"""
-        all_plants = self.get_all_plant_types()
+        all_plants = self._all_plants
         if plant_name not in all_plants:
             return False
+        plant_type = all_plants[plant_name]
         
         # Handle tool purchases
-        if any(tool in plant_name for tool in ['Fertilizer', 'Hoe', 'Shovel']):
-            tool_type = None
-            if 'Fertilizer' in plant_name:
-                tool_type = 'fertilizer'
-                current_level = player.fertilizer_level
-            elif 'Hoe' in plant_name:
-                tool_type = 'hoe'
-                current_level = player.hoe_level
-            elif 'Shovel' in plant_name:
-                tool_type = 'shovel'
-                current_level = player.shovel_level
-                
-            level_name = plant_name.split()[0]  # Iron, Gold, or Diamond
-            level_map = {'Iron': 1, 'Gold': 2, 'Diamond': 3}
-            required_level = level_map[level_name]
+        tool_id = plant_type.tool_id
+        if tool_id is not None:
+            current_level = player.tool_levels[tool_id]
+            required_level = plant_type.tool_level
             
             if current_level >= required_level:
                 return False  # Already have this or higher
             if current_level != required_level - 1:
                 return False  # Need to buy in order
                 
-            total_cost = all_plants[plant_name].seed_cost
+            total_cost = plant_type.seed_cost
             if player.money >= total_cost:
                 player.money -= total_cost
-                if tool_type == 'fertilizer':
-                    player.fertilizer_level = required_level
-                elif tool_type == 'hoe':
-                    player.hoe_level = required_level
-                else:  # shovel
-                    player.shovel_level = required_level
+                player.tool_levels[tool_id] = required_level
                 return True
             return False
         
         # Regular seed purchase
-        total_cost = all_plants[plant_name].seed_cost * quantity
+        total_cost = plant_type.seed_cost * quantity
         if player.money >= total_cost:
             player.money -= total_cost
-            player.inventory.add_seeds(plant_name, quantity)
+            player.inventory.add_seeds(plant_type.item_id, quantity)
             return True
         return False
         
     def sell_item(self, player: Player, item_name: str, quantity: int = 1) -> bool:
         """Sell harvested items"""
-        all_plants = self.get_all_plant_types()
+        all_plants = self._all_plants
         if item_name not in all_plants:
             return False
             
-        if player.inventory.remove_item(item_name, quantity):
+        if player.inventory.remove_item(all_plants[item_name].item_id, quantity):
             total_value = all_plants[item_name].sell_value * quantity
             player.money += total_value
             return True
@@ -1049,28 +1442,57 @@ class Shop:
         
     def sell_all_items(self, player: Player) -> float:
         """Sell all items in inventory, return total money earned"""
-        all_plants = self.get_all_plant_types()
-        total_earned = 0.0
-        
-        items_to_sell = list(player.inventory.items.items())
-        for item_name, quantity in items_to_sell:
-            if item_name in all_plants:
-                value = all_plants[item_name].sell_value * quantity
-                total_earned += value
-                player.money += value
-                del player.inventory.items[item_name]
+        # Sum quantity * value over all item ids in one pass, then empty the inventory at once
+        total_earned = sum(map(operator.mul, player.inventory.item_counts, self._sell_values), 0.0)
+        player.inventory.clear_items()
+        player.money += total_earned
         
         return total_earned
         
+    def get_row_text(self, name: str, plant_type: PlantType, row_state: str) -> str:
+        """Format the info text of a shop row"""
+        if plant_type.tool_kind is not None:
+            if row_state == 'owned':
+                return f"{name}: PURCHASED"
+            elif row_state == 'locked':
+                return f"{name}: ${plant_type.seed_cost:,.0f} (Need previous level)"
+            return f"{name}: ${plant_type.seed_cost:,.0f}"
+        
+        # Regular plant info display
+        time_str = f"{plant_type.growth_time:.0f}s"
+        size_str = f"{plant_type.size[0]}x{plant_type.size[1]}" if plant_type.size != (1, 1) else "1x1"
+        
+        if plant_type.seed_cost < 10:
+            cost_str = f"${plant_type.seed_cost:.2f}"
+        else:
+            cost_str = f"${plant_type.seed_cost:,.0f}"
+        
+        if plant_type.sell_value < 10:
+            sell_str = f"${plant_type.sell_value:.2f}"
+        else:
+            sell_str = f"${plant_type.sell_value:,.0f}"
+            
+        return f"{name}: {cost_str} -> {sell_str} ({time_str}) [{size_str}]"
+        
+    def get_clicked_item(self, pos) -> Optional[str]:
+        """Get the name of the item whose buy button is at pos, if any"""
+        if not self.buttons_bbox.collidepoint(pos):
+            return None
+        # Buttons sit one per row, so the row follows from the click height
+        row = (pos[1] - self.buttons_bbox.y) // self.row_height
+        if row < len(self.buy_buttons):
+            button_rect, name = self.buy_buttons[row]
+            if button_rect.collidepoint(pos):
+                return name
+        return None
+        
     def draw(self, screen: pygame.Surface, player: Player, font, small_font):
         """Draw shop interface when open"""
         if not self.is_open:
             return
             
-        # Shop background with rounded corners effect - 0.75x width
-        original_width = SCREEN_WIDTH - 200
-        shop_width = int(original_width * 0.75)
-        shop_rect = pygame.Rect((SCREEN_WIDTH - shop_width) // 2, 80, shop_width, SCREEN_HEIGHT - 160)
+        # Shop background with rounded corners effect
+        shop_rect = self.shop_rect
         pygame.draw.rect(screen, WHITE, shop_rect)
         pygame.draw.rect(screen, BLACK, shop_rect, 4)
         
@@ -1088,127 +1510,99 @@ class Shop:
         # Remove top page navigation and arrows
         # Only keep bottom navigation elements
         
-        # Navigation triangles at bottom with increased spacing
-        bottom_y = shop_rect.bottom - 40
-        
+        # Navigation triangles at bottom, only for pages that exist
+        nav_buttons = self.nav_buttons
+        nav_buttons.clear()
         if self.current_page > 0:
             # Left black filled triangle
-            left_points = [
-                (shop_rect.centerx - 100, bottom_y),
-                (shop_rect.centerx - 80, bottom_y - 15),
-                (shop_rect.centerx - 80, bottom_y + 15)
-            ]
-            pygame.draw.polygon(screen, BLACK, left_points)
-            left_rect = pygame.Rect(shop_rect.centerx - 100, bottom_y - 15, 20, 30)
-            self.nav_buttons.append(('prev', left_rect))
+            pygame.draw.polygon(screen, BLACK, self.prev_points)
+            nav_buttons.append(('prev', self.prev_rect))
         
         # Page number text
         page_text = font.render(f"Page {self.current_page + 1}/{self.max_page + 1}", True, BLACK)
-        page_rect = page_text.get_rect(center=(shop_rect.centerx, bottom_y))
+        page_rect = page_text.get_rect(center=(shop_rect.centerx, self.nav_y))
         screen.blit(page_text, page_rect)
         
         if self.current_page < self.max_page:
             # Right black filled triangle
-            right_points = [
-                (shop_rect.centerx + 100, bottom_y),
-                (shop_rect.centerx + 80, bottom_y - 15),
-                (shop_rect.centerx + 80, bottom_y + 15)
-            ]
-            pygame.draw.polygon(screen, BLACK, right_points)
-            right_rect = pygame.Rect(shop_rect.centerx + 80, bottom_y - 15, 20, 30)
-            self.nav_buttons.append(('next', right_rect))
+            pygame.draw.polygon(screen, BLACK, self.next_points)
+            nav_buttons.append(('next', self.next_rect))
         
         # Item list with buy buttons
-        y_offset = 70
-        row_height = 35
+        y_offset = self.row_y_offset
+        row_height = self.row_height
         
         # Clear previous buttons
-        self.buy_buttons = []
-        
-        for i, (name, plant_type) in enumerate(current_category['plants'].items()):
+        buy_buttons = self.buy_buttons
+        buy_buttons.clear()
+        tool_levels = player.tool_levels
+        if small_font is not self._text_font:
+            self._text_font = small_font
+            self._row_text_cache.clear()
+            self._label_cache.clear()
+        row_text_cache = self._row_text_cache
+        label_cache = self._label_cache
+        button_surfaces = self.button_surfaces
+        button_blits = []  # Button backgrounds, then row texts and button labels, blitted after the loop
+        text_blits = []
+        
+        button_rects = self.button_rects
+        for i, (name, plant_type) in enumerate(self._page_items[self.current_page]):
             y = shop_rect.y + y_offset + (i * row_height)
-            if y > shop_rect.bottom - 100:  # Don't draw below shop area
-                break
                 
             # Handle all tools display (Fertilizer, Hoe, Shovel)
-            if any(tool in name for tool in ['Fertilizer', 'Hoe', 'Shovel']):
-                tool_type = None
-                if 'Fertilizer' in name:
-                    tool_type = 'fertilizer'
-                    current_level = player.fertilizer_level
-                elif 'Hoe' in name:
-                    tool_type = 'hoe'
-                    current_level = player.hoe_level
-                elif 'Shovel' in name:
-                    tool_type = 'shovel'
-                    current_level = player.shovel_level
-                    
-                level_name = name.split()[0]  # Iron, Gold, or Diamond
-                level_map = {'Iron': 1, 'Gold': 2, 'Diamond': 3}
-                required_level = level_map[level_name]
-                
+            if plant_type.tool_id is not None:
+                current_level = tool_levels[plant_type.tool_id]
+                required_level = plant_type.tool_level
                 if current_level >= required_level:
-                    info_text = f"{name}: PURCHASED"
-                    color = GRAY
+                    row_state = 'owned'
                 elif current_level != required_level - 1:
-                    info_text = f"{name}: ${plant_type.seed_cost:,.0f} (Need previous level)"
-                    color = GRAY
+                    row_state = 'locked'
                 else:
-                    info_text = f"{name}: ${plant_type.seed_cost:,.0f}"
-                    color = BLACK if player.money >= plant_type.seed_cost else GRAY
+                    row_state = 'available'
             else:
-                # Regular plant info display (unchanged)
-                time_str = f"{plant_type.growth_time:.0f}s"
-                size_str = f"{plant_type.size[0]}x{plant_type.size[1]}" if plant_type.size != (1, 1) else "1x1"
-                
-                if plant_type.seed_cost < 10:
-                    cost_str = f"${plant_type.seed_cost:.2f}"
-                else:
-                    cost_str = f"${plant_type.seed_cost:,.0f}"
-                
-                if plant_type.sell_value < 10:
-                    sell_str = f"${plant_type.sell_value:.2f}"
-                else:
-                    sell_str = f"${plant_type.sell_value:,.0f}"
-                    
-                info_text = f"{name}: {cost_str} -> {sell_str} ({time_str}) [{size_str}]"
-                color = BLACK if player.money >= plant_type.seed_cost else GRAY
-                    
-            plant_text = small_font.render(info_text, True, color)
-            screen.blit(plant_text, (shop_rect.x + 30, y))
+                row_state = 'available'
+            can_buy = row_state == 'available' and player.money >= plant_type.seed_cost
+            color = BLACK if can_buy else GRAY
+            
+            # Row text only changes with the row state and color, so render it once per combination
+            row_key = (name, row_state, color)
+            plant_text = row_text_cache.get(row_key)
+            if plant_text is None:
+                plant_text = small_font.render(self.get_row_text(name, plant_type, row_state), True, color)
+                row_text_cache[row_key] = plant_text
+            text_blits.append((plant_text, (shop_rect.x + 30, y)))
                 
             # Buy button
-            if any(tool in name for tool in ['Fertilizer', 'Hoe', 'Shovel']):
-                if current_level >= required_level:
-                    button_color = GRAY
-                    button_text = "OWNED"
-                elif current_level != required_level - 1 or player.money < plant_type.seed_cost:
-                    button_color = GRAY
-                    button_text = "BUY"
-                else:
-                    button_color = GREEN
-                    button_text = "BUY"
-            else:
-                button_color = GREEN if player.money >= plant_type.seed_cost else GRAY
-                button_text = "BUY"
+            button_color = GREEN if can_buy else GRAY
+            button_text = "OWNED" if row_state == 'owned' else "BUY"
             
-            button_rect = pygame.Rect(shop_rect.right - 120, y - 5, 80, 25)
-            pygame.draw.rect(screen, button_color, button_rect)
-            pygame.draw.rect(screen, BLACK, button_rect, 2)
+            button_rect = button_rects[i]
+            button_blits.append((button_surfaces[button_color], button_rect))
             
-            buy_text = small_font.render(button_text, True, BLACK)
-            text_rect = buy_text.get_rect(center=button_rect.center)
-            screen.blit(buy_text, text_rect)
+            # Labels are cached with their offset from the button's top-left corner
+            label = label_cache.get(button_text)
+            if label is None:
+                buy_text = small_font.render(button_text, True, BLACK)
+                label = label_cache[button_text] = (
+                    buy_text, (button_rect.w // 2 - buy_text.get_width() // 2, button_rect.h // 2 - buy_text.get_height() // 2))
+            buy_text, (label_dx, label_dy) = label
+            text_blits.append((buy_text, (button_rect.x + label_dx, button_rect.y + label_dy)))
             
-            # Store button info for click detection
-            button_info = (button_rect.copy(), name)  # Use copy() to ensure we get a new rect
-            self.buy_buttons.append(button_info)
+            # Store button info for click detection; row rects are fixed, so they can be shared
+            buy_buttons.append((button_rect, name))
+        
+        screen.blits(button_blits, doreturn=False)
+        screen.blits(text_blits, doreturn=False)
 
 class GameWorld:
     def __init__(self):
         self.map = Map()
         self.player = Player(TILE_SIZE * MAP_WIDTH // 2, TILE_SIZE * MAP_HEIGHT // 2)
-        self.plants: Dict[Tuple[int, int], Plant] = {}
+        self.plants: Dict[int, Plant] = {}  # Plant on each occupied tile, keyed by tile_key
+        self.plant_set: Set[Plant] = set()  # Each plant once, for per-plant updates
+        self.harvestable_tiles: Set[int] = set()  # tile_key of every tile covered by a harvestable plant
+        self.plant_grid = PlantGrid()  # Each plant once, for viewport queries
         self.weather = Weather()
         self.day_night = DayNightCycle()
         self.shop = Shop()
@@ -1217,42 +1611,63 @@ class GameWorld:
         self.camera_x = 0
         self.camera_y = 0
         self.mouse_pos = (0, 0)
-        self.error_message = ""
-        self.error_timer = 0.0
+        # Plant under the mouse, looked up again only when the hovered tile_key changes
+        self.hover_tile: Optional[int] = None
+        self.hover_plant: Optional[Plant] = None
+        # Hover timer text, re-rendered only when its text or color changes
+        self.hover_key: Optional[Tuple[str, tuple]] = None
+        self.hover_surface: Optional[pygame.Surface] = None
+        self.error_message = ""  # Shown until the error_until tick, then cleared
+        self.error_until = 0
+        # Slightly larger font for the info display (50% bigger instead of 70%)
+        self.info_font = pygame.font.Font(None, int(24 * 1.5))  # Reduced from 1.7 to 1.5
+        # Rendered UI texts keyed by (text, font, color), emptied when it grows past TEXT_CACHE_LIMIT
+        self.text_cache: Dict[Tuple[str, pygame.font.Font, tuple], pygame.Surface] = {}
+        # Semi-transparent info and inventory box backgrounds, with their borders, built once
+        self.info_bg = self.build_ui_box(300, 160)
+        self.inventory_bg = self.build_ui_box(187, 400)  # 10% wider than original 170
+        # Buff box text, rebuilt only when weather, fertilizer level or player tile changes
+        self.buff_key: Optional[Tuple[WeatherType, int, Tuple[int, int]]] = None
+        self.buff_surface: Optional[pygame.Surface] = None
+        self.buff_growth_mult = 1.0  # Weather times fertilizer multiplier, also used by the hover timer
+        # Tool level lines of the info box, rebuilt only when a tool level changes
+        self.tool_levels_shown: Optional[Tuple[int, ...]] = None
+        self.tool_blits: List[Tuple[pygame.Surface, Tuple[int, int]]] = []
         
     def update(self, dt: float, keys, events):
         """Update all game systems"""
-        # Update error message timer
-        if self.error_timer > 0:
-            self.error_timer -= dt
-            if self.error_timer <= 0:
-                self.error_message = ""
+        now = pygame.time.get_ticks()  # One clock read shared by this whole update
+        
+        # Clear the error message once it expires
+        if self.error_message and now >= self.error_until:
+            self.error_message = ""
         
         # Update player
         self.player.update(dt, keys, self.map)
         
         # Update camera to follow player smoothly
-        target_camera_x = self.player.x - SCREEN_WIDTH // 2
-        target_camera_y = self.player.y - SCREEN_HEIGHT // 2
+        player = self.player
+        camera_x = self.camera_x
+        camera_y = self.camera_y
+        follow = dt * 6
         
         # Smooth camera movement
-        self.camera_x += (target_camera_x - self.camera_x) * dt * 6
-        self.camera_y += (target_camera_y - self.camera_y) * dt * 6
+        camera_x += (player.x - SCREEN_WIDTH // 2 - camera_x) * follow
+        camera_y += (player.y - SCREEN_HEIGHT // 2 - camera_y) * follow
         
         # Clamp camera to map bounds
-        self.camera_x = max(0, min(MAP_WIDTH * TILE_SIZE - SCREEN_WIDTH, self.camera_x))
-        self.camera_y = max(0, min(MAP_HEIGHT * TILE_SIZE - SCREEN_HEIGHT, self.camera_y))
+        self.camera_x = 0 if camera_x < 0 else (CAMERA_MAX_X if camera_x > CAMERA_MAX_X else camera_x)
+        self.camera_y = 0 if camera_y < 0 else (CAMERA_MAX_Y if camera_y > CAMERA_MAX_Y else camera_y)
         
         # Update weather and day/night
         self.weather.update(dt)
         self.day_night.update(dt)
         
         # Update plants
-        weather_multiplier = self.weather.get_growth_multiplier()
-        fertilizer_multiplier = self.player.get_fertilizer_multiplier()
-        for plant in self.plants.values():
-            tile_type = self.map.tiles[plant.y][plant.x]  # Get tile type for plant location
-            plant.update(weather_multiplier, fertilizer_multiplier, tile_type)
+        # Weather and fertilizer are the same for every plant, so combine them once
+        growth_multiplier = self.weather.get_growth_multiplier() * self.player.get_fertilizer_multiplier()
+        for plant in tick_plants(self.plant_set, now, growth_multiplier):
+            self.harvestable_tiles.update(plant.tile_keys)
         
         # Handle events
         for event in events:
@@ -1279,8 +1694,7 @@ class GameWorld:
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 if event.button == 1:  # Left click
                     # Check help button click first
-                    help_button_rect = pygame.Rect(15, SCREEN_HEIGHT - 50, 35, 35)
-                    if help_button_rect.collidepoint(event.pos):
+                    if HELP_BUTTON_RECT.collidepoint(event.pos):
                         self.help_dialog.toggle()
                     elif self.shop.is_open:
                         # Check navigation button clicks
@@ -1296,26 +1710,34 @@ class GameWorld:
                             self.handle_shop_click(event.pos)
             elif event.type == pygame.MOUSEMOTION:
                 self.mouse_pos = event.pos
+        
+        # Update the hovered plant once the mouse or camera moves onto another tile
+        hover_tile = tile_key(int((self.mouse_pos[0] + self.camera_x) // TILE_SIZE),
+                              int((self.mouse_pos[1] + self.camera_y) // TILE_SIZE))
+        if hover_tile != self.hover_tile:
+            self.hover_tile = hover_tile
+            self.hover_plant = self.plants.get(hover_tile)
                 
     def can_plant_at(self, x: int, y: int, size: Tuple[int, int]) -> bool:
         """Check if a plant of given size can be placed at position"""
         width, height = size
         
-        # Check if all tiles are within bounds and tillable
-        for dy in range(height):
-            for dx in range(width):
-                check_x, check_y = x + dx, y + dy
-                
-                # Check bounds
-                if check_x < 0 or check_x >= MAP_WIDTH or check_y < 0 or check_y >= MAP_HEIGHT:
-                    return False
-                
-                # Check if tillable
-                if not self.map.is_tillable(check_x, check_y):
-                    return False
-                
-                # Check if already occupied by plant
-                if (check_x, check_y) in self.plants:
+        # Check bounds for the whole rectangle at once
+        if x < 0 or y < 0 or x + width > MAP_WIDTH or y + height > MAP_HEIGHT:
+            return False
+        
+        # Check that every row of the rectangle is tillable, one C-level scan per row
+        tillable_mask = self.map.tillable_mask
+        for row_start in range(y * MAP_WIDTH + x, (y + height) * MAP_WIDTH, MAP_WIDTH):
+            if tillable_mask.find(0, row_start, row_start + width) != -1:
+                return False
+        
+        # Check if already occupied by plant
+        plants = self.plants
+        for check_y in range(y, y + height):
+            row_key = check_y << 16  # tile_key, inlined
+            for check_x in range(x, x + width):
+                if row_key | check_x in plants:
                     return False
         
         return True
@@ -1326,21 +1748,9 @@ class GameWorld:
         
         # Try positions in expanding circles around player up to planting range
         for radius in range(planting_range + 1):
-            positions = []
-            
-            if radius == 0:
-                positions = [(player_x, player_y)]
-            else:
-                # Generate positions in a circle around player
-                for dx in range(-radius, radius + 1):
-                    for dy in range(-radius, radius + 1):
-                        if abs(dx) == radius or abs(dy) == radius:  # Only edge of circle
-                            positions.append((player_x + dx, player_y + dy))
-            
-            # Shuffle to avoid bias toward specific directions
-            random.shuffle(positions)
-            
-            for x, y in positions:
+            # Closest tiles of each ring first, in a fixed order
+            for dx, dy in get_ring_offsets(radius):
+                x, y = player_x + dx, player_y + dy
                 if self.can_plant_at(x, y, size):
                     return (x, y)
         
@@ -1349,7 +1759,7 @@ class GameWorld:
     def show_error(self, message: str):
         """Show error message for a few seconds"""
         self.error_message = message
-        self.error_timer = 3.0  # Show for 3 seconds
+        self.error_until = pygame.time.get_ticks() + 3000  # Show for 3 seconds
                 
     # Remove this duplicate method
     # def handle_harvesting(self):
@@ -1372,25 +1782,23 @@ class GameWorld:
         player_tile_x, player_tile_y = self.player.get_tile_position()
         harvest_range = self.player.get_harvest_range()  # Get current shovel range
         
-        # Check all tiles within harvest range
-        for dy in range(-harvest_range, harvest_range + 1):
-            for dx in range(-harvest_range, harvest_range + 1):
-                check_x = player_tile_x + dx
-                check_y = player_tile_y + dy
-                
-                # Only check tiles within the circular range
-                if math.sqrt(dx*dx + dy*dy) <= harvest_range:
-                    if (check_x, check_y) in self.plants:
-                        plant = self.plants[(check_x, check_y)]
-                        if plant.harvestable:
-                            # Harvest the plant - remove from all occupied tiles
-                            occupied_tiles = plant.get_occupied_tiles()
-                            for tile in occupied_tiles:
-                                if tile in self.plants:
-                                    del self.plants[tile]
-                            
-                            # Add harvested item to inventory
-                            self.player.inventory.add_item(plant.plant_type.name, 1)
+        # Check all tiles within the circular harvest range; the probing runs in C against the
+        # harvestable tiles only, and each ready plant in range reaches Python once
+        plants = self.plants
+        harvestable_tiles = self.harvestable_tiles
+        in_range = {plants[key] for key in harvestable_tiles.intersection(map(
+            tile_key(player_tile_x, player_tile_y).__add__, get_harvest_offsets(harvest_range)))}
+        for plant in in_range:
+            # Harvest the plant - remove from all occupied tiles
+            for key in plant.tile_keys:
+                plants.pop(key, None)
+            harvestable_tiles.difference_update(plant.tile_keys)
+            self.plant_set.discard(plant)
+            self.plant_grid.remove(plant)
+            self.hover_tile = None  # The hovered tile may have just been cleared
+            
+            # Add harvested item to inventory
+            self.player.inventory.add_item(plant.plant_type.item_id, 1)
                     
     def is_in_sell_area(self) -> bool:
         """Check if player is in the selling area"""
@@ -1402,30 +1810,29 @@ class GameWorld:
         if not self.shop.is_open:
             return
             
-        # Check each buy button
-        for button_rect, plant_name in self.shop.buy_buttons:
-            if button_rect.collidepoint(pos):
-                # Try to buy the item
-                success = self.shop.buy_seeds(self.player, plant_name)
-                if not success:
-                    # Show error message if purchase failed
-                    all_plants = self.shop.get_all_plant_types()
-                    if plant_name in all_plants:
-                        plant_type = all_plants[plant_name]
-                        if self.player.money < plant_type.seed_cost:
-                            self.show_error(f"Not enough money! Need ${plant_type.seed_cost:,.2f}")
-                        else:
-                            self.show_error("Cannot purchase this item yet!")
-                break
+        # Find the clicked buy button, if any
+        plant_name = self.shop.get_clicked_item(pos)
+        if plant_name is not None:
+            # Try to buy the item
+            success = self.shop.buy_seeds(self.player, plant_name)
+            if not success:
+                # Show error message if purchase failed
+                all_plants = self.shop.get_all_plant_types()
+                if plant_name in all_plants:
+                    plant_type = all_plants[plant_name]
+                    if self.player.money < plant_type.seed_cost:
+                        self.show_error(f"Not enough money! Need ${plant_type.seed_cost:,.2f}")
+                    else:
+                        self.show_error("Cannot purchase this item yet!")
 
     def handle_planting(self):
         """Handle P key for planting with multi-tile support"""
         player_tile_x, player_tile_y = self.player.get_tile_position()
         
         # Find first available seed in inventory
-        for plant_name, quantity in self.player.inventory.seeds.items():
+        for item_id, quantity in enumerate(self.player.inventory.seed_counts):
             if quantity > 0:
-                plant_type = self.shop.get_all_plant_types()[plant_name]
+                plant_type = self.shop.get_all_plant_types()[ITEM_NAMES[item_id]]
                 
                 # Find suitable planting location
                 planting_spot = self.find_planting_spot(player_tile_x, player_tile_y, plant_type.size)
@@ -1435,14 +1842,16 @@ class GameWorld:
                     return
                 # Plant the seed at found location
                 plant_x, plant_y = planting_spot
-                new_plant = Plant(plant_type, plant_x, plant_y)
+                new_plant = Plant(plant_type, plant_x, plant_y, self.map.tile_at(plant_x, plant_y))
                 
                 # Add plant to all tiles it occupies
-                for tile in new_plant.get_occupied_tiles():
-                    self.plants[tile] = new_plant
+                self.plants.update(dict.fromkeys(new_plant.tile_keys, new_plant))
+                self.plant_set.add(new_plant)
+                self.plant_grid.add(new_plant)
+                self.hover_tile = None  # The hovered tile may have just been planted
                 
                 # Remove seed from inventory
-                self.player.inventory.use_seed(plant_name)
+                self.player.inventory.use_seed(item_id)
                 return
         
         self.show_error("No seeds in inventory!")
@@ -1455,18 +1864,28 @@ class GameWorld:
         # Draw map
         self.map.draw(screen, int(self.camera_x), int(self.camera_y))
         
-        # Draw plants
-        for plant in set(self.plants.values()):  # Use set to avoid drawing duplicates
-            plant.draw(screen, int(self.camera_x), int(self.camera_y))
+        # Draw plants as one batched blit of their cached stage sprites
+        camera_x, camera_y = int(self.camera_x), int(self.camera_y)
+        # Only plants in grid cells near the viewport; the margin covers big plants anchored off screen.
+        # Sprites in those cells that still miss the screen are clipped by the blit itself.
+        start_x = camera_x // TILE_SIZE - PLANT_DRAW_MARGIN
+        start_y = camera_y // TILE_SIZE - PLANT_DRAW_MARGIN
+        end_x = (camera_x + SCREEN_WIDTH) // TILE_SIZE + PLANT_DRAW_MARGIN
+        end_y = (camera_y + SCREEN_HEIGHT) // TILE_SIZE + PLANT_DRAW_MARGIN
+        plant_blits = [plant.get_blit(camera_x, camera_y)
+                       for plant in self.plant_grid.query_rect(start_x, start_y, end_x, end_y)]
+        screen.blits(plant_blits, doreturn=False)
         
         # Draw player
         self.player.draw(screen, int(self.camera_x), int(self.camera_y))
         
         # Draw weather effects
-        self.weather.draw_effects(screen)
+        if self.weather.has_effects:
+            self.weather.draw_effects(screen)
         
         # Draw day/night overlay
-        self.day_night.draw_overlay(screen)
+        if self.day_night.overlay_alpha > 0:
+            self.day_night.draw_overlay(screen)
         
         # Draw minimap
         self.minimap.draw(screen, self.player.x, self.player.y)
@@ -1481,138 +1900,141 @@ class GameWorld:
         # Draw help dialog if open
         self.help_dialog.draw(screen, font, small_font)
 
+    def build_ui_box(self, width: int, height: int) -> pygame.Surface:
+        """Build a white, 50% transparent UI box with a black border"""
+        box = pygame.Surface((width, height), pygame.SRCALPHA).convert_alpha()
+        box.fill((255, 255, 255, 128))  # White with 50% transparency
+        pygame.draw.rect(box, BLACK, box.get_rect(), 2)
+        return box
+        
+    def render_text(self, text: str, font, color: tuple) -> pygame.Surface:
+        """Render UI text, reusing the surface while the same text is shown"""
+        key = (text, font, color)
+        surface = self.text_cache.get(key)
+        if surface is None:
+            if len(self.text_cache) >= TEXT_CACHE_LIMIT:
+                self.text_cache.clear()  # Drop texts that went stale, like old money amounts
+            surface = self.text_cache[key] = font.render(text, True, color)
+        return surface
+        
     def draw_ui(self, screen: pygame.Surface, font, small_font):
         """Draw UI elements"""
-        # Create slightly larger font for info display (50% bigger instead of 70%)
-        info_font = pygame.font.Font(None, int(24 * 1.5))  # Reduced from 1.7 to 1.5
+        info_font = self.info_font
+        render_text = self.render_text
         
         # Draw top-left info box
         info_box_x = 10
         info_box_y = 10
-        info_box_width = 300
-        info_box_height = 160
+        info_box_height = self.info_bg.get_height()
         
         # Info box with semi-transparent background
-        info_surface = pygame.Surface((info_box_width, info_box_height), pygame.SRCALPHA)
-        info_surface.fill((255, 255, 255, 128))  # White with 50% transparency
-        screen.blit(info_surface, (info_box_x, info_box_y))
-        pygame.draw.rect(screen, BLACK, (info_box_x, info_box_y, info_box_width, info_box_height), 2)
+        screen.blit(self.info_bg, (info_box_x, info_box_y))
         
         # Draw weather indicator with larger font
-        weather_text = info_font.render(f"Weather: {self.weather.current_weather.value.capitalize()}", True, BLACK)
+        weather_text = render_text(f"Weather: {self.weather.current_weather.value.capitalize()}", info_font, BLACK)
         screen.blit(weather_text, (info_box_x + 10, info_box_y + 10))
         
         # Draw current buff info
-        player_tile_x, player_tile_y = self.player.get_tile_position() # Get player's current tile to show soil buff
-        weather_mult = self.weather.get_growth_multiplier()
-        fert_mult = self.player.get_fertilizer_multiplier()
-        soil_mult = 1.1 if self.map.tiles[player_tile_y][player_tile_x] == 'soil' else 1.0
-        total_mult = weather_mult * fert_mult * soil_mult
-        
-        buff_text = info_font.render(f"Total Buff: {total_mult:.2f}x", True, BLACK)
-        screen.blit(buff_text, (info_box_x + 10, info_box_y + 40))
+        player_tile = self.player.get_tile_position() # Get player's current tile to show soil buff
+        buff_key = (self.weather.current_weather, self.player.fertilizer_level, player_tile)
+        if buff_key != self.buff_key:
+            on_soil = self.map.tile_at(*player_tile) == SOIL
+            weather_mult = self.weather.get_growth_multiplier()
+            fert_mult = self.player.get_fertilizer_multiplier()
+            soil_mult = SOIL_GROWTH_BONUS if on_soil else 1.0
+            self.buff_growth_mult = weather_mult * fert_mult
+            total_mult = weather_mult * fert_mult * soil_mult
+            self.buff_surface = render_text(f"Total Buff: {total_mult:.2f}x", info_font, BLACK)
+            self.buff_key = buff_key
+        screen.blit(self.buff_surface, (info_box_x + 10, info_box_y + 40))
         
         # Draw tool levels with simplified display
-        tool_y = info_box_y + 70
-        tools = [
-            f"Fertilizer: {['Basic', 'Iron', 'Gold', 'Diamond'][self.player.fertilizer_level]}",
-            f"Hoe: {['Basic', 'Iron', 'Gold', 'Diamond'][self.player.hoe_level]}",
-            f"Shovel: {['Basic', 'Iron', 'Gold', 'Diamond'][self.player.shovel_level]}"
-        ]
-        
-        for tool_info in tools:
-            text = info_font.render(tool_info, True, BLACK)
-            screen.blit(text, (info_box_x + 10, tool_y))
-            tool_y += 28  # Reduced spacing from 35 to 28
+        tool_levels = tuple(self.player.tool_levels)
+        if tool_levels != self.tool_levels_shown:
+            tool_y = info_box_y + 70
+            self.tool_blits = []
+            for labels, level in zip(TOOL_LABELS, tool_levels):
+                self.tool_blits.append((render_text(labels[level], info_font, BLACK), (info_box_x + 10, tool_y)))
+                tool_y += 28  # Reduced spacing from 35 to 28
+            self.tool_levels_shown = tool_levels
+        screen.blits(self.tool_blits, doreturn=False)
         
         # Draw inventory box below info box
         inventory_x = 10
         inventory_y = info_box_y + info_box_height + 20  # 20px gap between boxes
-        inventory_width = 187  # 10% wider than original 170
-        inventory_height = 400
         
         # Background with semi-transparent white
-        inventory_surface = pygame.Surface((inventory_width, inventory_height), pygame.SRCALPHA)
-        inventory_surface.fill((255, 255, 255, 128))  # White with 50% transparency
-        screen.blit(inventory_surface, (inventory_x, inventory_y))
-        pygame.draw.rect(screen, BLACK, (inventory_x, inventory_y, inventory_width, inventory_height), 2)
+        screen.blit(self.inventory_bg, (inventory_x, inventory_y))
         
         # Title
-        inv_title = font.render("Inventory", True, BLACK)
+        inv_title = render_text("Inventory", font, BLACK)
         screen.blit(inv_title, (inventory_x + 10, inventory_y + 10))
         
         # Money display at top of inventory - using small_font now
-        money_text = small_font.render(f"Money: ${self.player.money:,.2f}", True, BLACK)
+        money_text = render_text(f"Money: ${self.player.money:,.2f}", small_font, BLACK)
         screen.blit(money_text, (inventory_x + 10, inventory_y + 40))
         
         # Seeds section
         y_offset = inventory_y + 80
-        seeds_text = small_font.render("Seeds:", True, BLACK)
+        seeds_text = render_text("Seeds:", small_font, BLACK)
         screen.blit(seeds_text, (inventory_x + 10, y_offset))
         
         # Display seeds in inventory with limit
         y_offset += 20
         max_visible_items = 12  # Adjust this number based on your UI
-        visible_seeds = list(self.player.inventory.seeds.items())
+        visible_seeds = self.player.inventory.get_seeds()
         hidden_seeds = len(visible_seeds) - max_visible_items
         
         for i, (seed_name, quantity) in enumerate(visible_seeds):
             if i < max_visible_items:
-                text = small_font.render(f"{seed_name}: {quantity}", True, BLACK)
+                text = render_text(f"{seed_name}: {quantity}", small_font, BLACK)
                 screen.blit(text, (inventory_x + 20, y_offset))
                 y_offset += 20
             else:
-                text = small_font.render(f"and {hidden_seeds} others...", True, BLACK)
+                text = render_text(f"and {hidden_seeds} others...", small_font, BLACK)
                 screen.blit(text, (inventory_x + 20, y_offset))
                 break
         
         # Items section with similar logic
         y_offset += 20
-        items_text = small_font.render("Items:", True, BLACK)
+        items_text = render_text("Items:", small_font, BLACK)
         screen.blit(items_text, (inventory_x + 10, y_offset))
         
         y_offset += 20
-        visible_items = list(self.player.inventory.items.items())
+        visible_items = self.player.inventory.get_items()
         hidden_items = len(visible_items) - max_visible_items
         
         for i, (item_name, quantity) in enumerate(visible_items):
             if i < max_visible_items:
-                text = small_font.render(f"{item_name}: {quantity}", True, BLACK)
+                text = render_text(f"{item_name}: {quantity}", small_font, BLACK)
                 screen.blit(text, (inventory_x + 20, y_offset))
                 y_offset += 20
             else:
-                text = small_font.render(f"and {hidden_items} others...", True, BLACK)
+                text = render_text(f"and {hidden_items} others...", small_font, BLACK)
                 screen.blit(text, (inventory_x + 20, y_offset))
                 break
         
         # Help button (bottom left)
-        help_button_rect = pygame.Rect(15, SCREEN_HEIGHT - 50, 35, 35)
-        pygame.draw.rect(screen, WHITE, help_button_rect)
-        pygame.draw.rect(screen, BLACK, help_button_rect, 2)
+        pygame.draw.rect(screen, WHITE, HELP_BUTTON_RECT)
+        pygame.draw.rect(screen, BLACK, HELP_BUTTON_RECT, 2)
         
         # Question mark
-        text = font.render("?", True, BLACK)
-        text_rect = text.get_rect(center=help_button_rect.center)
+        text = render_text("?", font, BLACK)
+        text_rect = text.get_rect(center=HELP_BUTTON_RECT.center)
         screen.blit(text, text_rect)
         
         # Draw error message if active
-        if self.error_timer > 0:
-            error_surface = font.render(self.error_message, True, RED)
+        if self.error_message:
+            error_surface = render_text(self.error_message, font, RED)
             error_rect = error_surface.get_rect(center=(SCREEN_WIDTH // 2, 50))
             screen.blit(error_surface, error_rect)
         
         # Draw hover plant info with colored timer based on buff
-        mouse_tile_x = int((self.mouse_pos[0] + self.camera_x) // TILE_SIZE)
-        mouse_tile_y = int((self.mouse_pos[1] + self.camera_y) // TILE_SIZE)
-
-        if (mouse_tile_x, mouse_tile_y) in self.plants:
-            plant = self.plants[(mouse_tile_x, mouse_tile_y)]
+        plant = self.hover_plant
+        if plant is not None:
             
-            # Calculate total multiplier including soil
-            weather_mult = self.weather.get_growth_multiplier()
-            fert_mult = self.player.get_fertilizer_multiplier()
-            soil_mult = 1.1 if self.map.tiles[plant.y][plant.x] == 'soil' else 1.0
-            total_mult = weather_mult * fert_mult * soil_mult
+            # Calculate total multiplier including soil, reusing the buff box's weather and fertilizer product
+            total_mult = self.buff_growth_mult * plant.growth_rate
             
             # Get base time remaining
             time_left = plant.time_remaining
@@ -1627,8 +2049,12 @@ class GameWorld:
 
             # Draw with larger info_font instead of small_font
             info_text = f"{plant.plant_type.name} - Time Remaining: {time_left:.1f}s"
-            info_surface = info_font.render(info_text, True, timer_color)  # Using info_font instead of small_font
-            screen.blit(info_surface, (10, SCREEN_HEIGHT - 80))
+            hover_key = (info_text, timer_color)
+            if hover_key != self.hover_key:
+                # Rendered directly: the ticking timer would only churn the shared text cache
+                self.hover_surface = info_font.render(info_text, True, timer_color)  # Using info_font instead of small_font
+                self.hover_key = hover_key
+            screen.blit(self.hover_surface, (10, SCREEN_HEIGHT - 80))
 
 # Initialize and run game
 async def main():
@@ -1639,12 +2065,16 @@ async def main():
     font = pygame.font.Font(None, 36)
     small_font = pygame.font.Font(None, 24)
     world = GameWorld()
+    # Only queue the events the game reacts to; held keys are polled, so KEYUP isn't needed
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN, pygame.MOUSEMOTION])
     running = True
     while running:
         events = pygame.event.get()
         for event in events:
             if event.type == pygame.QUIT:
                 running = False
+        # Discrete actions come from events; this single poll only feeds held-key movement
         keys = pygame.key.get_pressed()
         dt = clock.tick(FPS) / 1000.0
         world.update(dt, keys, events)